@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+
+"""
+    Headless rendering benchmark for all screens. The screens are rendered with the dummy video driver of SDL, so
+    no display is needed. For every screen and resolution the construction and configuration time, the time per
+    frame for update and blit as well as the memory used by the screen is reported as JSON.
+
+    Usage:
+        python3 benchmark.py [--frames 300] [--resolutions 720p,1080p,4k] [--slideshow-path PATH] [--output FILE]
+"""
+
+import os
+import gc
+
+# The video and audio driver must be set before pygame is initialised by the import of the screens
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import sys
+import json
+import time
+import shutil
+import random
+import argparse
+import platform
+import tempfile
+
+import pygame
+
+from firefinder.util_screen import Screen, DEFAULT_PIC_DIR
+from firefinder.util_logger import Logger
+from firefinder.util_tick import tick_service
+
+RESOLUTIONS = {
+    "720p":  (1280, 720),
+    "1080p": (1920, 1080),
+    "4k":    (3840, 2160),
+}
+
+ALARM_SHORT = "A1, Brand klein, Ittigen;Ey,19, Kehrichtbrand"
+ALARM_LONG = ("AA, AA Sprinkler, Ittigen;Mühlestrasse,2, Verwaltungszentrum UVEK Ittigen, 225 276 (Verwaltungszentrum "
+              "Mühlestrasse Ittigen), Sprinkleranlage im Untergeschoss ausgelöst, Zufahrt über die Tiefgarage, "
+              "Schlüsseldepot beim Haupteingang, Kontaktperson Hauswart vor Ort, POL informiert und unterwegs, "
+              "Rauchentwicklung im Treppenhaus gemeldet, Personen im Gebäude möglich")
+EQUIPMENT_SHORT = ["Fz_1.png", "Fz_2.png"]
+EQUIPMENT_LONG = ["Fz_1.png", "Fz_2.png", "Fz_4.png", "Fz_5.png", "Fz_6.png", "Fz_7.png", "Fz_8.png", "Fz_9.png",
+                  "MS.png", "Fz_Florian.png"]
+
+
+def get_rss_bytes():
+    """
+    Return the resident memory of this process in bytes, None if it is not available on this platform
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def create_slideshow_fixture(path, amount=5, size=(4000, 3000)):
+    """
+    Create photo-sized JPEG images, so the slideshow has to decode and scale like with real camera pictures
+    """
+    rnd = random.Random(42)
+    for i in range(amount):
+        surface = pygame.Surface(size)
+        surface.fill((rnd.randrange(256), rnd.randrange(256), rnd.randrange(256)))
+        for _ in range(200):
+            color = (rnd.randrange(256), rnd.randrange(256), rnd.randrange(256))
+            rect = (rnd.randrange(size[0]), rnd.randrange(size[1]), rnd.randrange(50, 800), rnd.randrange(50, 800))
+            pygame.draw.rect(surface, color, rect)
+        pygame.image.save(surface, os.path.join(path, f"fixture_{i:02d}.jpg"))
+
+
+def get_scenarios(slideshow_path, cache_path):
+    """
+    Return a list of (name, screen, configuration) to benchmark. The slideshow uses its own image cache, so the
+    cache of an installation is neither used nor pruned by the benchmark.
+    """
+    logo = os.path.join(DEFAULT_PIC_DIR, "Logo.png")
+    direction = os.path.join(DEFAULT_PIC_DIR, "p005_1_04.jpg")
+    return [
+        ("splash", Screen.splash, {"company_path_logo": logo}),
+        ("clock", Screen.clock, {}),
+        ("slideshow", Screen.slideshow, {"cache_path":             cache_path,
+                                         "slideshow_path":         slideshow_path,
+                                         "seconds_between_images": 0,
+                                         "company_path_logo":      logo,
+                                         "company_name":           "Feuerwehr"}),
+        ("event_short", Screen.event, {"alarm_message":       ALARM_SHORT,
+                                       "image_left":          direction,
+                                       "image_right":         "",
+                                       "show_progress_bar":   True,
+                                       "show_response_order": True,
+                                       "equipment_list":      EQUIPMENT_SHORT}),
+        ("event_long", Screen.event, {"alarm_message":       ALARM_LONG,
+                                      "image_left":          direction,
+                                      "image_right":         direction,
+                                      "show_progress_bar":   True,
+                                      "show_response_order": True,
+                                      "equipment_list":      EQUIPMENT_LONG}),
+        ("off", Screen.off, {}),
+    ]
+
+
+def get_timing(values):
+    values = sorted(values)
+    if not values:
+        return None
+    return {"avg_ms": sum(values) / len(values) * 1000,
+            "p50_ms": values[len(values) // 2] * 1000,
+            "p95_ms": values[min(int(len(values) * 0.95), len(values) - 1)] * 1000,
+            "max_ms": values[-1] * 1000}
+
+
+def run_scenario(window, screen_name, screen_config, frames, logger):
+    # Free the screens of the last scenario, otherwise they are part of the memory difference
+    gc.collect()
+    rss_before = get_rss_bytes()
+
+    time_start = time.perf_counter()
+    screen_obj = screen_name.value(size=window.get_size(), logger=logger)
+    construct_time = time.perf_counter() - time_start
+
+    time_start = time.perf_counter()
+    screen_obj.activate()
+    screen_obj.configure(**screen_config)
+    configure_time = time.perf_counter() - time_start
+
+    # Render like the GuiThread does, but without waiting for the next frame
+    update_times = []
+    blit_times = []
+    dirty_pixels = 0
+    for i in range(frames):
+        time_start = time.perf_counter()
+        tick_service.tick()
+        screen_obj.update()
+        update_times.append(time.perf_counter() - time_start)
+
+        time_start = time.perf_counter()
+        dirty_rects = screen_obj.get_dirty_rects()
+        if i == 0:
+            window.blit(screen_obj, (0, 0))
+            pygame.display.flip()
+        elif dirty_rects:
+            for rect in dirty_rects:
+                window.blit(screen_obj, rect, rect)
+            pygame.display.update(dirty_rects)
+        blit_times.append(time.perf_counter() - time_start)
+        dirty_pixels += sum(rect.width * rect.height for rect in dirty_rects)
+
+    rss_after = get_rss_bytes()
+    screen_obj.deactivate()
+
+    return {
+        "construct_ms":           construct_time * 1000,
+        "configure_ms":           configure_time * 1000,
+        "update":                 get_timing(update_times),
+        "blit":                   get_timing(blit_times),
+        "frame":                  get_timing([u + b for u, b in zip(update_times, blit_times)]),
+        "dirty_pixels_per_frame": dirty_pixels / frames if frames else 0,
+        "next_frame_delay_s":     screen_obj.get_next_frame_delay(),
+        "memory_bytes":           rss_after - rss_before if rss_before is not None and rss_after is not None else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless rendering benchmark for all FireFinder screens")
+    parser.add_argument("--frames", type=int, default=300, help="Frames rendered per screen and resolution")
+    parser.add_argument("--resolutions", default=",".join(RESOLUTIONS),
+                        help=f"Comma separated list of {', '.join(RESOLUTIONS)} or WIDTHxHEIGHT")
+    parser.add_argument("--slideshow-path", default="",
+                        help="Folder with images for the slideshow. If empty, photo-sized fixtures are generated")
+    parser.add_argument("--screens", default="", help="Comma separated list of scenarios, default all")
+    parser.add_argument("--output", default="", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    temp_dir = tempfile.mkdtemp(prefix="firefinder_benchmark_")
+    logger = Logger(verbose=False, file_path=os.path.join(temp_dir, "benchmark.log"))
+
+    slideshow_path = args.slideshow_path
+    if not slideshow_path:
+        slideshow_path = os.path.join(temp_dir, "slideshow")
+        os.makedirs(slideshow_path)
+        create_slideshow_fixture(slideshow_path)
+
+    selected_screens = [s.strip() for s in args.screens.split(",") if s.strip()]
+
+    report = {
+        "python":   sys.version.split()[0],
+        "pygame":   pygame.version.ver,
+        "sdl":      ".".join(str(v) for v in pygame.get_sdl_version()),
+        "platform": platform.platform(),
+        "machine":  platform.machine(),
+        "frames":   args.frames,
+        "results":  dict(),
+    }
+
+    try:
+        for resolution_name in [r.strip() for r in args.resolutions.split(",") if r.strip()]:
+            if resolution_name in RESOLUTIONS:
+                size = RESOLUTIONS[resolution_name]
+            else:
+                size = tuple(int(v) for v in resolution_name.lower().split("x"))
+
+            window = pygame.display.set_mode(size)
+            results = dict()
+            for name, screen_name, screen_config in get_scenarios(slideshow_path, os.path.join(temp_dir, "image_cache")):
+                if selected_screens and name not in selected_screens:
+                    continue
+                print(f"Benchmark '{name}' at {size[0]}x{size[1]}", file=sys.stderr)
+                results[name] = run_scenario(window        = window,
+                                             screen_name   = screen_name,
+                                             screen_config = screen_config,
+                                             frames        = args.frames,
+                                             logger        = logger)
+            report["results"][resolution_name] = results
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    report_json = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report_json)
+    else:
+        print(report_json)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
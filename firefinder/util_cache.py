@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+from collections import OrderedDict
+
+
+class SurfaceCache(object):
+    def __init__(self, max_bytes, max_entry_share=0.5):
+        """
+        Least recently used cache for surfaces, limited by the memory of their pixels. Subclasses create the
+        surfaces and store them with _put(). The surfaces are shared, they must not be modified by the caller.
+
+        :param max_bytes:       Maximum memory of all cached surfaces
+        :param max_entry_share: Share of max_bytes a single surface may use at most, larger ones are not cached
+        """
+        self.max_bytes       = max_bytes
+        self.max_entry_share = max_entry_share
+
+        self._lock    = threading.Lock()
+        self._entries = OrderedDict()
+        self._bytes   = 0
+        self.hits     = 0
+        self.misses   = 0
+
+    @staticmethod
+    def _get_size(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def _get(self, key):
+        """
+        Return the cached surface and mark it as recently used, None if it is not cached
+        """
+        with self._lock:
+            surface = self._entries.get(key)
+            if surface is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+    def _put(self, key, surface):
+        """
+        Store the surface and remove the least recently used ones until all fit into max_bytes
+        """
+        size = self._get_size(surface)
+        with self._lock:
+            # Do not cache surfaces which would replace the whole cache
+            if size > self.max_bytes * self.max_entry_share or key in self._entries:
+                return
+            self._entries[key] = surface
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, removed = self._entries.popitem(last=False)
+                self._bytes -= self._get_size(removed)
+
+    def get_statistics(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {"entries":  len(self._entries),
+                    "bytes":    self._bytes,
+                    "hits":     self.hits,
+                    "misses":   self.misses,
+                    "hit_rate": self.hits / total if total else 0}
@@ -9,6 +9,7 @@ import configparser
 from pathlib import Path
 from firefinder.util_screen import GuiHandler, get_screen_obj_from_string
 from firefinder.util_logger import Logger
+from firefinder.util_latency import latency_tracker, LatencyStage
 
 
 def get_screen_config(screen_name: str, config_obj: configparser.ConfigParser, basedir: str):
@@ -101,6 +102,8 @@ class FileWatch(object):
 
             if file_time != last_modified_time:
                 last_modified_time = file_time
+                latency_tracker.begin(written_at=file_time)
+                latency_tracker.mark(LatencyStage.file_changed)
 
                 logger.debug("FileModifiedEvent raised")
 
@@ -119,6 +122,7 @@ class FileWatch(object):
                 except configparser.MissingSectionHeaderError:
                     # If failing, try UTF-8 with BOM
                     config_obj.read(path_obj.resolve(), encoding='utf-8-sig')
+                latency_tracker.mark(LatencyStage.file_parsed)
 
                 screen_name = config_obj.get("General", "show", fallback=None)
                 if screen_name is None or screen_name == "":
@@ -134,5 +138,6 @@ class FileWatch(object):
                 screen_config = get_screen_config(screen_name = screen_name,
                                                   config_obj  = config_obj,
                                                   basedir     = str(path_obj.parent))
+                latency_tracker.mark(LatencyStage.config_done)
                 callback(screen_name=screen_obj, screen_config=screen_config)
 
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+import pygame
+import threading
+
+from firefinder.util_cache import SurfaceCache
+
+TEXT_CACHE_MAX_BYTES = 32 * 1024 * 1024  # Memory for rendered texts, the least recently used are removed first
+
+
+class FontRegistry(object):
+    def __init__(self):
+        """
+        Load every combination of font and size only once and share it with all surfaces and screens. Loading a
+        font-file or searching an installed font is expensive and shall not happen while an alarm is shown.
+        """
+        self._lock  = threading.Lock()
+        self._fonts = dict()
+
+    @staticmethod
+    def _load(font_name, font_size):
+        # Check if font name is installed or is it a font-file
+        if ".ttf" in font_name:
+            font = pygame.font.Font(font_name, font_size)
+        else:
+            font = pygame.font.SysFont(font_name, font_size)
+        return font
+
+    def get(self, font_name, font_size):
+        """
+        Return the font with the given size, load it if it is requested the first time. The returned font is
+        shared, do not change its settings (bold, italic, underline).
+
+        :param font_name: Path to a font-file or name of an installed font
+        :param font_size: Height of the font in pixel
+        """
+        key = (font_name, int(font_size))
+        font = self._fonts.get(key)
+        if font is None:
+            with self._lock:
+                font = self._fonts.get(key)
+                if font is None:
+                    font = self._load(font_name, int(font_size))
+                    self._fonts[key] = font
+        return font
+
+    def preload(self, font_name, font_sizes):
+        """
+        Load the font in all given sizes in advance
+        """
+        for font_size in font_sizes:
+            self.get(font_name, font_size)
+
+
+# Shared instance, all surfaces use the same fonts
+font_registry = FontRegistry()
+
+
+def get_font_obj(font_name, font_size):
+    return font_registry.get(font_name=font_name, font_size=font_size)
+
+
+class TextCache(SurfaceCache):
+    def __init__(self, max_bytes=TEXT_CACHE_MAX_BYTES):
+        """
+        Least recently used cache for rendered texts. Most texts (clock, header, progress bar) change at most once
+        per second but are drawn with every frame, so rendering them only once saves the glyph rasterization.
+
+        The returned surfaces are shared, they must not be modified by the caller.
+
+        :param max_bytes: Maximum memory of all cached surfaces
+        """
+        super(TextCache, self).__init__(max_bytes=max_bytes, max_entry_share=0.25)
+
+    def render(self, text, font_name, font_size, color, background=None, antialias=True):
+        """
+        Return the rendered text, either from the cache or rendered now
+
+        :param text:       Text to render
+        :param font_name:  Path to a font-file or name of an installed font
+        :param font_size:  Height of the font in pixel
+        :param color:      Color of the text
+        :param background: Color of the background, None for a transparent background
+        :param antialias:  Render the text with smooth edges
+        """
+        font_size = int(font_size)
+        color = tuple(pygame.Color(color))
+        if background is not None:
+            background = tuple(pygame.Color(background))
+        key = (text, font_name, font_size, color, background, antialias)
+
+        surface = self._get(key)
+        if surface is not None:
+            return surface
+
+        font = get_font_obj(font_name=font_name, font_size=font_size)
+        surface = font.render(text, antialias, color, background)
+
+        self._put(key, surface)
+        return surface
+
+
+# Shared instance, the same texts are drawn by several surfaces and screens
+text_cache = TextCache()
+
+
+def render_text(text, font_name, font_size, color, background=None, antialias=True):
+    """
+    Render the text with the shared text cache. The returned surface must not be modified.
+    """
+    return text_cache.render(text=text, font_name=font_name, font_size=font_size, color=color, background=background,
+                             antialias=antialias)
@@ -0,0 +1,919 @@
+# -*- coding: utf-8 -*-
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+    ImageOps = None
+
+import os
+import re
+import math
+import bisect
+import random
+import fnmatch
+import shutil
+import struct
+import pygame
+import hashlib
+import threading
+
+from collections import deque
+
+from firefinder.util_cache import SurfaceCache
+
+IMAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024  # Memory for decoded images, the least recently used are removed first
+PREFETCH_AMOUNT = 2  # Amount of images which are decoded and scaled ahead of time
+DISK_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".firefinder", "image_cache")
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.bmp', '.png', '.gif', '.eps', '.tif', '.tiff')
+ATLAS_MAX_WIDTH = 4096  # Maximum width of an image atlas, the images are placed in several rows
+IMAGE_DECODERS = ("pygame", "pillow")  # Available libraries to decode the image files
+EXIF_ORIENTATION = 0x0112
+
+DISK_CACHE_EXTENSION = ".raw"
+DISK_CACHE_HEADER = struct.Struct("<4sHII4s")  # Magic, version, width, height, pixel format
+DISK_CACHE_MAGIC = b"FFIC"
+DISK_CACHE_VERSION = 1
+DISK_CACHE_NAME_PATTERN = re.compile(r"[0-9a-f]{40}" + re.escape(DISK_CACHE_EXTENSION))  # sha1 of the key
+DISK_CACHE_SIZE_PATTERN = re.compile(r"\d+x\d+")  # Sub folder for every image size
+DISK_CACHE_SIZES = 3  # Image sizes kept in the cache, e.g. with and without header bar
+DISK_CACHE_MAX_BYTES = 1024 * 1024 * 1024  # Disk space for cached images, the least recently used are removed first
+DISK_CACHE_MIN_FREE_BYTES = 256 * 1024 * 1024  # Free disk space which is never used by the cache
+
+# frombytes and tobytes replace fromstring and tostring since pygame 2.1.3
+_image_frombytes = getattr(pygame.image, "frombytes", None) or pygame.image.fromstring
+_image_tobytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+
+
+def scale_image(image_obj, max_width=None, max_height=None, crop=False, keep_ratio=True):
+    # Get the original image dimensions
+    width, height = image_obj.get_size()
+
+    # Determine the scaling factor for width and height
+    width_scale = float(max_width) / width if max_width else 1.0
+    height_scale = float(max_height) / height if max_height else 1.0
+
+    # Determine the scaling factor to use based on the largest dimension
+    if crop:
+        # Crop the image if necessary to fit within the given dimensions
+        scale_factor = max(width_scale, height_scale)
+    else:
+        # Scale the image down proportionally to fit within the given dimensions
+        scale_factor = min(width_scale, height_scale)
+
+    # Calculate the new image size after scaling
+    new_width = int(width * scale_factor)
+    new_height = int(height * scale_factor)
+
+    # Scale the image using the new dimensions
+    try:
+        scaled_image = pygame.transform.smoothscale(image_obj, (new_width, new_height))
+    except ValueError:
+        scaled_image = pygame.transform.scale(image_obj, (new_width, new_height))
+
+    if crop:
+        # If cropping, create a new surface with the target dimensions and blit the scaled image onto it
+        target_surface = pygame.Surface((max_width, max_height))
+        target_surface.blit(scaled_image, ((max_width - new_width) // 2, (max_height - new_height) // 2))
+        return target_surface
+    else:
+        # If scaling, return the scaled image directly
+        return scaled_image
+
+
+_image_decoder = "pygame"
+
+
+def set_image_decoder(decoder):
+    """
+    Select the library which decodes the image files. Pillow decodes photos in JPEG format directly in a reduced
+    size and turns them according to their EXIF orientation, pygame always decodes the full resolution.
+
+    :param decoder: One of IMAGE_DECODERS
+    :return:        True if the decoder is used, False if Pillow is not installed and pygame is used instead
+    """
+    global _image_decoder
+    if decoder not in IMAGE_DECODERS:
+        raise ValueError(f"Unknown image decoder '{decoder}', use one of {', '.join(IMAGE_DECODERS)}")
+    if decoder == "pillow" and Image is None:
+        _image_decoder = "pygame"
+        return False
+    _image_decoder = decoder
+    return True
+
+
+def get_image_decoder():
+    return _image_decoder
+
+
+def _decode_with_pillow(path, max_width=None, max_height=None, crop=False):
+    with Image.open(path) as pil_image:
+        # Turned images have width and height swapped until the EXIF orientation is applied
+        width, height = pil_image.size
+        turned = pil_image.getexif().get(EXIF_ORIENTATION, 1) in (5, 6, 7, 8)
+        if turned:
+            width, height = height, width
+
+        # Let the JPEG decoder scale the image by 1/2, 1/4 or 1/8 while decoding. The draft is never smaller than
+        # the requested size, the exact size is scaled afterwards.
+        if pil_image.format == "JPEG" and (max_width or max_height):
+            width_scale = float(max_width) / width if max_width else float(max_height) / height
+            height_scale = float(max_height) / height if max_height else width_scale
+            scale_factor = max(width_scale, height_scale) if crop else min(width_scale, height_scale)
+            if scale_factor < 1.0:
+                draft_size = (math.ceil(width * scale_factor), math.ceil(height * scale_factor))
+                if turned:
+                    draft_size = draft_size[::-1]
+                pil_image.draft("RGB", draft_size)
+
+        pil_image = ImageOps.exif_transpose(pil_image)
+        if pil_image.mode in ("RGBA", "LA", "PA") or "transparency" in pil_image.info:
+            mode = "RGBA"
+        else:
+            mode = "RGB"
+        if pil_image.mode != mode:
+            pil_image = pil_image.convert(mode)
+
+        # The surface uses the pixels of the bytes object, they are not copied again
+        return pygame.image.frombuffer(pil_image.tobytes(), pil_image.size, mode)
+
+
+def decode_image(path, max_width=None, max_height=None, crop=False):
+    """
+    Decode the image file with the selected decoder. The size of the returned image is at least the size of the
+    target box, but not exactly scaled to it. Use scale_image() to get the final size.
+
+    :param path:       Path to the image file
+    :param max_width:  Maximum width the image is shown with, None to only scale by the height
+    :param max_height: Maximum height the image is shown with, None to only scale by the width
+    :param crop:       The image will fill the whole box instead of fitting into the box
+    """
+    if _image_decoder == "pillow":
+        return _decode_with_pillow(path, max_width=max_width, max_height=max_height, crop=crop)
+    return pygame.image.load(path)
+
+
+def convert_for_display(image_obj):
+    """
+    Convert the image to the pixel format of the display, which makes every blit much faster. Images with
+    transparency keep their alpha channel. Nothing is converted as long as no display is available.
+    """
+    if pygame.display.get_surface() is None:
+        return image_obj
+    if image_obj.get_flags() & pygame.SRCALPHA:
+        return image_obj.convert_alpha()
+    return image_obj.convert()
+
+
+class ImageCache(SurfaceCache):
+    def __init__(self, max_bytes=IMAGE_CACHE_MAX_BYTES):
+        """
+        Least recently used cache for decoded and scaled images. The same vehicle pictures, logos and direction
+        images are shown over and over again, so they are decoded and scaled only once per target size.
+
+        An entry is only valid as long as the file is not modified (modification time and size), a changed file
+        is loaded again. The returned surfaces are shared, they must not be modified by the caller.
+
+        :param max_bytes: Maximum memory of all cached images
+        """
+        super(ImageCache, self).__init__(max_bytes=max_bytes, max_entry_share=0.5)
+
+    def load(self, path, max_width=None, max_height=None, crop=False):
+        """
+        Return the image scaled to fit into max_width x max_height, either from the cache or loaded now
+
+        :param path:       Path to the image file
+        :param max_width:  Maximum width of the image, None to only scale by the height
+        :param max_height: Maximum height of the image, None to only scale by the width
+        :param crop:       Fill the whole box and cut the overlapping part instead of fitting into the box
+        """
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size, max_width, max_height, crop, _image_decoder)
+
+        image_obj = self._get(key)
+        if image_obj is not None:
+            return image_obj
+
+        image_obj = decode_image(path, max_width=max_width, max_height=max_height, crop=crop)
+        if max_width or max_height:
+            image_obj = scale_image(image_obj=image_obj, max_width=max_width, max_height=max_height, crop=crop)
+        image_obj = convert_for_display(image_obj)
+
+        self._put(key, image_obj)
+        return image_obj
+
+
+# Shared instance, the same images are used by several surfaces and screens
+image_cache = ImageCache()
+
+
+def load_image(path, max_width=None, max_height=None, crop=False):
+    """
+    Load and scale the image with the shared image cache. The returned surface must not be modified.
+    """
+    return image_cache.load(path=path, max_width=max_width, max_height=max_height, crop=crop)
+
+
+class GradientCache(object):
+    def __init__(self):
+        """
+        Vertical color gradients, created once per combination of colors and size. The gradient is calculated as a
+        strip of one pixel width, with NumPy if available, and scaled to the full width in a single step.
+        """
+        self._lock      = threading.Lock()
+        self._gradients = dict()
+
+    @staticmethod
+    def _render(top_color, bottom_color, size):
+        width, height = size
+        if numpy is not None:
+            t = numpy.linspace(0.0, 1.0, height)[:, None]
+            top = numpy.array(top_color[:3], dtype=float)
+            bottom = numpy.array(bottom_color[:3], dtype=float)
+            column = numpy.rint(top + (bottom - top) * t).astype(numpy.uint8)
+            strip = pygame.surfarray.make_surface(column[None, :, :])
+        else:
+            strip = pygame.Surface((1, height))
+            for y in range(height):
+                strip.set_at((0, y), top_color.lerp(bottom_color, y / (height - 1) if height > 1 else 0))
+        return convert_for_display(pygame.transform.scale(strip, (width, height)))
+
+    def get(self, top_color, bottom_color, size):
+        """
+        Return the gradient from the top to the bottom color. The returned surface is shared, it must not be modified
+
+        :param top_color:    Color of the first row
+        :param bottom_color: Color of the last row
+        :param size:         Width and height of the gradient
+        """
+        top_color = pygame.Color(top_color)
+        bottom_color = pygame.Color(bottom_color)
+        size = (int(size[0]), int(size[1]))
+        key = (tuple(top_color), tuple(bottom_color), size)
+
+        gradient = self._gradients.get(key)
+        if gradient is None:
+            with self._lock:
+                gradient = self._gradients.get(key)
+                if gradient is None:
+                    gradient = self._render(top_color, bottom_color, size)
+                    self._gradients[key] = gradient
+        return gradient
+
+    def preload(self, top_color, bottom_colors, size):
+        """
+        Create the gradients from the top color to all given bottom colors in advance
+        """
+        for bottom_color in bottom_colors:
+            self.get(top_color, bottom_color, size)
+
+
+# Shared instance, every surface with a gradient background uses it
+gradient_cache = GradientCache()
+
+
+def get_gradient(top_color, bottom_color, size):
+    return gradient_cache.get(top_color=top_color, bottom_color=bottom_color, size=size)
+
+
+def get_folder_signature(folder, pattern="*"):
+    """
+    Return name, modification time and size of all images in the folder whose name matches the pattern (not case
+    sensitive). The signature changes as soon as an image is added, removed or replaced.
+    """
+    signature = []
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            name = entry.name.lower()
+            if name.endswith(IMAGE_EXTENSIONS) and fnmatch.fnmatchcase(name, pattern.lower()) and entry.is_file():
+                stat = entry.stat()
+                signature.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(signature))
+
+
+class ImageAtlas(object):
+    def __init__(self, folder, pattern="*", max_width=None, max_height=None, logger=None):
+        """
+        The images of a folder scaled to the same maximum size and stored together in one surface in the display
+        format. Showing an image of the atlas is a lookup, no file has to be read.
+
+        :param folder:     Folder with the images, sub folders are ignored
+        :param pattern:    Only the images whose name matches this pattern (e.g. 'Fz_*') are part of the atlas
+        :param max_width:  Maximum width of every image
+        :param max_height: Maximum height of every image
+        :param logger:     Logger to report images which could not be loaded
+        """
+        self.folder     = folder
+        self.pattern    = pattern
+        self.max_width  = max_width
+        self.max_height = max_height
+        self.logger     = logger
+
+        self.signature = get_folder_signature(folder, pattern)
+        self.surface   = None
+        self._rects    = dict()
+        self._build()
+
+    def _build(self):
+        images = []
+        for name, _, _ in self.signature:
+            path = os.path.join(self.folder, name)
+            try:
+                image_obj = decode_image(path, max_width=self.max_width, max_height=self.max_height)
+                image_obj = scale_image(image_obj=image_obj, max_width=self.max_width, max_height=self.max_height)
+            except (pygame.error, OSError) as e:
+                if self.logger is not None:
+                    self.logger.error(f"Could not load image '{path}' into atlas", exception=e.args)
+                continue
+            images.append((name, image_obj))
+
+        # Place the images in rows from left to right, a new row is started if the atlas would get too wide
+        x = y = row_height = atlas_width = 0
+        for name, image_obj in images:
+            width, height = image_obj.get_size()
+            if x and x + width > ATLAS_MAX_WIDTH:
+                x = 0
+                y += row_height
+                row_height = 0
+            self._rects[name] = pygame.Rect(x, y, width, height)
+            x += width
+            row_height = max(row_height, height)
+            atlas_width = max(atlas_width, x)
+
+        self.surface = pygame.Surface((max(atlas_width, 1), max(y + row_height, 1)), pygame.SRCALPHA)
+        for name, image_obj in images:
+            self.surface.blit(image_obj, self._rects[name])
+        self.surface = convert_for_display(self.surface)
+
+    def get(self, name):
+        """
+        Return the image as sub surface of the atlas or None if it is not part of the atlas. The returned surface
+        shares its pixels with the atlas, it must not be modified.
+        """
+        rect = self._rects.get(name)
+        if rect is None:
+            return None
+        return self.surface.subsurface(rect)
+
+
+_atlas_lock = threading.Lock()
+_atlas_dict = dict()
+
+
+def get_image_atlas(folder, pattern="*", max_width=None, max_height=None, logger=None):
+    """
+    Return the atlas of the images in the folder matching the pattern for the given image size. It is built on the
+    first request and shared afterwards, until an image of the atlas is added, removed or replaced.
+    """
+    key = (os.path.abspath(folder), pattern, max_width, max_height)
+    signature = get_folder_signature(folder, pattern)
+    with _atlas_lock:
+        atlas = _atlas_dict.get(key)
+        if atlas is None or atlas.signature != signature:
+            atlas = ImageAtlas(folder=folder, pattern=pattern, max_width=max_width, max_height=max_height,
+                               logger=logger)
+            _atlas_dict[key] = atlas
+    return atlas
+
+
+class DiskImageCache(object):
+    def __init__(self, cache_dir=DISK_CACHE_DIR, max_bytes=DISK_CACHE_MAX_BYTES, logger=None):
+        """
+        Persistent cache of images scaled to their display size. The images are stored uncompressed, so after the
+        first decode an image is loaded with a single read instead of decoding a photo in full camera resolution.
+
+        An entry is identified by the path, modification time and size of the source file and the target box.
+        A modified source file therefore results in a new entry, the old one is removed by prune(). The entries of
+        every target box are stored in their own sub folder, the last DISK_CACHE_SIZES boxes are kept.
+
+        All entries together use at most max_bytes, the least recently used are removed first. No entry is written
+        if less than DISK_CACHE_MIN_FREE_BYTES would be left on the disk.
+
+        :param cache_dir: Folder for the cached images, created if it does not exist
+        :param max_bytes: Maximum disk space of all cached images
+        :param logger:    Logger to report errors while reading or writing the cache
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.logger    = logger
+
+        self._lock      = threading.Lock()
+        self._bytes     = None  # Disk space of all entries, counted again if unknown or the folder has changed
+        self._bytes_dir = None
+        self._disk_full = False  # Only log the first write which is skipped for lack of space
+
+    def _get_size_dir(self, max_width, max_height):
+        return os.path.join(self.cache_dir, f"{max_width or 0}x{max_height or 0}")
+
+    def _get_file_path(self, path, max_width, max_height):
+        stat = os.stat(path)
+        # The decoders differ in quality and orientation, so every decoder has its own entries
+        key = f"{os.path.abspath(path)}|{stat.st_mtime_ns}|{stat.st_size}|{max_width}|{max_height}|{_image_decoder}"
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self._get_size_dir(max_width, max_height), name + DISK_CACHE_EXTENSION)
+
+    @staticmethod
+    def _read(file_path):
+        with open(file_path, "rb") as f:
+            header = f.read(DISK_CACHE_HEADER.size)
+            magic, version, width, height, pixel_format = DISK_CACHE_HEADER.unpack(header)
+            if magic != DISK_CACHE_MAGIC or version != DISK_CACHE_VERSION:
+                raise ValueError(f"Unknown format of cached image '{file_path}'")
+            pixel_format = pixel_format.rstrip(b" ").decode("ascii")
+            data = f.read()
+        return _image_frombytes(data, (width, height), pixel_format)
+
+    def _write(self, file_path, image_obj):
+        """
+        Store the image in the cache and return True, False if there is not enough space left on the disk
+        """
+        pixel_format = "RGBA" if image_obj.get_flags() & pygame.SRCALPHA else "RGB"
+        header = DISK_CACHE_HEADER.pack(DISK_CACHE_MAGIC, DISK_CACHE_VERSION, image_obj.get_width(),
+                                        image_obj.get_height(), pixel_format.ljust(4).encode("ascii"))
+        data = _image_tobytes(image_obj, pixel_format)
+        size = len(header) + len(data)
+
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        if shutil.disk_usage(self.cache_dir).free - size < DISK_CACHE_MIN_FREE_BYTES:
+            return False
+        with self._lock:
+            self._reserve(size)
+
+        # Write to a temporary file first, so a partly written file is never taken as cached image
+        temp_path = f"{file_path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(header)
+            f.write(data)
+        os.replace(temp_path, file_path)
+        with self._lock:
+            self._bytes += size
+        return True
+
+    def _get_entries(self):
+        """
+        Return modification time, size and path of all images written by this cache, the oldest first
+        """
+        folders = [self.cache_dir]
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_dir() and DISK_CACHE_SIZE_PATTERN.fullmatch(entry.name):
+                folders.append(entry.path)
+
+        entries = []
+        for folder in folders:
+            for entry in os.scandir(folder):
+                if self._is_cache_file(entry):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return sorted(entries)
+
+    def _reserve(self, size):
+        """
+        Remove the least recently used images until an image of the given size fits into max_bytes. Only a tenth
+        of max_bytes is freed at least, so the folder is not scanned again for every new image.
+        """
+        if self._bytes is None or self._bytes_dir != self.cache_dir:
+            self._bytes = sum(entry_size for _, entry_size, _ in self._get_entries())
+            self._bytes_dir = self.cache_dir
+        if self._bytes + size <= self.max_bytes:
+            return
+
+        removed = 0
+        for _, entry_size, path in self._get_entries():
+            if self._bytes + size <= self.max_bytes * 0.9:
+                break
+            try:
+                os.remove(path)
+            except OSError as e:
+                if self.logger is not None:
+                    self.logger.warning(f"Could not remove cached image '{path}'", exception=e.args)
+                continue
+            self._bytes -= entry_size
+            removed += 1
+
+        if removed and self.logger is not None:
+            self.logger.info(f"Removed {removed} least recently used images from cache '{self.cache_dir}'")
+
+    def load(self, path, max_width=None, max_height=None):
+        """
+        Return the image scaled to fit into max_width x max_height. If it is not cached yet, the image is decoded,
+        scaled and stored in the cache. The returned surface is a new one and may be modified by the caller.
+
+        :param path:       Path to the image file
+        :param max_width:  Maximum width of the image
+        :param max_height: Maximum height of the image
+        """
+        file_path = self._get_file_path(path, max_width, max_height)
+        if os.path.isfile(file_path):
+            try:
+                image_obj = self._read(file_path)
+            except (OSError, ValueError, struct.error, pygame.error) as e:
+                if self.logger is not None:
+                    self.logger.warning(f"Could not read cached image '{file_path}', load it again", exception=e.args)
+            else:
+                # The modification time marks the image as recently used, the oldest images are removed first
+                try:
+                    os.utime(file_path)
+                except OSError:
+                    pass
+                return convert_for_display(image_obj)
+
+        image_obj = decode_image(path, max_width=max_width, max_height=max_height)
+        if max_width or max_height:
+            image_obj = scale_image(image_obj=image_obj, max_width=max_width, max_height=max_height)
+
+        try:
+            written = self._write(file_path, image_obj)
+            if not written and not self._disk_full and self.logger is not None:
+                self.logger.warning(f"Not enough space left on the disk, images are not stored in cache "
+                                    f"'{self.cache_dir}'")
+            self._disk_full = not written
+        except (OSError, pygame.error) as e:
+            if self.logger is not None:
+                self.logger.warning(f"Could not write cached image '{file_path}'", exception=e.args)
+
+        return convert_for_display(image_obj)
+
+    @staticmethod
+    def _is_cache_file(entry):
+        """
+        Return True if the directory entry is an image written by this cache. The cache folder can be configured,
+        so any other file in it must never be removed.
+        """
+        if not DISK_CACHE_NAME_PATTERN.fullmatch(entry.name) or not entry.is_file():
+            return False
+        try:
+            with open(entry.path, "rb") as f:
+                return f.read(len(DISK_CACHE_MAGIC)) == DISK_CACHE_MAGIC
+        except OSError:
+            return False
+
+    def prune(self, paths, max_width=None, max_height=None):
+        """
+        Remove the cached images of the given size except the ones of the given paths. Images of deleted or
+        modified source files are removed this way. Of the other sizes only the most recently used are kept.
+        Only files written by this cache are removed.
+
+        :param paths:      List of image paths which are still in use
+        :param max_width:  Maximum width of the images in use
+        :param max_height: Maximum height of the images in use
+        """
+        if not os.path.isdir(self.cache_dir):
+            return
+
+        in_use = set()
+        for path in paths:
+            try:
+                in_use.add(os.path.basename(self._get_file_path(path, max_width, max_height)))
+            except OSError:
+                # Source file has been removed in the meantime
+                pass
+
+        size_dir = self._get_size_dir(max_width, max_height)
+        removed = self._remove_files(size_dir, keep=in_use)
+
+        # Mark the size as used now and remove the sizes which have not been used for the longest time
+        size_dirs = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_dir() and DISK_CACHE_SIZE_PATTERN.fullmatch(entry.name) and entry.path != size_dir:
+                size_dirs.append((entry.stat().st_mtime, entry.path))
+        for _, path in sorted(size_dirs, reverse=True)[DISK_CACHE_SIZES - 1:]:
+            removed += self._remove_files(path)
+            try:
+                os.rmdir(path)
+            except OSError:
+                # Folder contains other files
+                pass
+        if os.path.isdir(size_dir):
+            os.utime(size_dir)
+
+        # Images of a former version of the cache are stored directly in the cache folder
+        removed += self._remove_files(self.cache_dir)
+
+        if removed:
+            # Count the disk space of the cache again with the next write
+            with self._lock:
+                self._bytes = None
+            if self.logger is not None:
+                self.logger.info(f"Removed {removed} outdated images from cache '{self.cache_dir}'")
+
+    def _remove_files(self, folder, keep=()):
+        """
+        Remove all images written by this cache in the folder except the ones in keep and return their amount
+        """
+        if not os.path.isdir(folder):
+            return 0
+
+        removed = 0
+        for entry in os.scandir(folder):
+            if entry.name not in keep and self._is_cache_file(entry):
+                try:
+                    os.remove(entry.path)
+                    removed += 1
+                except OSError as e:
+                    if self.logger is not None:
+                        self.logger.warning(f"Could not remove cached image '{entry.path}'", exception=e.args)
+        return removed
+
+
+class ImagePrefetcher(object):
+    def __init__(self, amount=PREFETCH_AMOUNT, disk_cache=None, logger=None, name="ImagePrefetcher"):
+        """
+        Decode and scale the next images of a sequence in a background thread, so the render thread only has to
+        take the prepared images. At most 'amount' images are held ready.
+
+        The returned surfaces may be shared with the image cache, they must not be modified by the caller.
+
+        :param amount:     Maximum amount of prepared images
+        :param disk_cache: DiskImageCache to load the images from, None to use the shared image cache
+        :param logger:     Logger to report images which could not be loaded
+        :param name:       Name of the worker thread
+        """
+        self.amount     = amount
+        self.disk_cache = disk_cache
+        self.logger     = logger
+        self.name       = name
+
+        self._condition  = threading.Condition()
+        self._ready      = deque()
+        self._paths      = []
+        self._next_index = 0
+        self._generation = 0
+        self._max_width  = None
+        self._max_height = None
+        self._prune      = False
+        self._thread     = None
+        self._running    = False
+
+    def set_sequence(self, paths, start_index=0, max_width=None, max_height=None):
+        """
+        Start to prefetch the given paths beginning at start_index. The sequence starts over at the beginning after
+        the last path. Already prepared images of a former sequence are dropped. Outdated images of the disk cache
+        are removed by the worker thread before it prepares the first image.
+
+        :param paths:       List of image paths
+        :param start_index: Index of the first path to prefetch
+        :param max_width:   Maximum width of the images
+        :param max_height:  Maximum height of the images
+        """
+        with self._condition:
+            self._generation += 1
+            self._ready.clear()
+            self._paths      = list(paths)
+            self._next_index = start_index
+            self._max_width  = max_width
+            self._max_height = max_height
+            self._prune      = self.disk_cache is not None
+            self._condition.notify_all()
+        self.start()
+
+    def get(self):
+        """
+        Return the next prepared image as tuple (index, path, surface) or None if it is not ready yet. The surface
+        is None if the image could not be loaded.
+        """
+        with self._condition:
+            if not self._ready:
+                return None
+            item = self._ready.popleft()
+            self._condition.notify_all()
+            return item
+
+    def start(self):
+        """
+        Start the worker thread if a sequence is set. It continues with the sequence where stop() has left it
+        """
+        with self._condition:
+            if self._running or not self._paths:
+                return
+            self._running = True
+            # A former worker which has not ended yet stops as soon as it sees that it has been replaced
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+            self._condition.notify_all()
+
+    def stop(self):
+        """
+        Stop the worker thread. The sequence and the prepared images are kept
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+
+    def _run(self):
+        thread = threading.current_thread()
+        while True:
+            with self._condition:
+                while (self._running and self._thread is thread and
+                       (not self._paths or len(self._ready) >= self.amount)):
+                    self._condition.wait()
+                if not self._running or self._thread is not thread:
+                    break
+                generation = self._generation
+                index      = self._next_index % len(self._paths)
+                path       = self._paths[index]
+                max_width  = self._max_width
+                max_height = self._max_height
+                paths      = self._paths
+                prune      = self._prune
+                self._prune = False
+                self._next_index = index + 1
+
+            if prune:
+                try:
+                    self.disk_cache.prune(paths=paths, max_width=max_width, max_height=max_height)
+                except OSError as e:
+                    if self.logger is not None:
+                        self.logger.warning("Could not remove outdated images from cache", exception=e.args)
+
+            try:
+                if self.disk_cache is not None:
+                    surface = self.disk_cache.load(path, max_width=max_width, max_height=max_height)
+                else:
+                    surface = load_image(path, max_width=max_width, max_height=max_height)
+            except (pygame.error, OSError) as e:
+                if self.logger is not None:
+                    self.logger.error(f"Could not load image '{path}'", exception=e.args)
+                surface = None
+
+            with self._condition:
+                # Drop the image if the sequence has been changed in the meantime
+                if generation == self._generation:
+                    self._ready.append((index, path, surface))
+
+
+def get_image_size(path):
+    """
+    Read the width and height of a JPEG, PNG, GIF or BMP image from its header without decoding the image.
+    Return None for other formats or if the header could not be read.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(26)
+            if head.startswith(b"\x89PNG\r\n\x1a\n"):
+                return struct.unpack(">II", head[16:24])
+            if head[:6] in (b"GIF87a", b"GIF89a"):
+                return struct.unpack("<HH", head[6:10])
+            if head.startswith(b"BM"):
+                width, height = struct.unpack("<ii", head[18:26])
+                return width, abs(height)
+            if head.startswith(b"\xff\xd8"):
+                # Walk through the JPEG segments until the start of frame, which holds the size
+                f.seek(2)
+                while True:
+                    marker = f.read(2)
+                    if len(marker) != 2 or marker[0] != 0xFF:
+                        return None
+                    while marker[1] == 0xFF:
+                        marker = marker[1:] + f.read(1)
+                    length = struct.unpack(">H", f.read(2))[0]
+                    if marker[1] in (0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF):
+                        height, width = struct.unpack(">xHH", f.read(5))
+                        return width, height
+                    f.seek(length - 2, os.SEEK_CUR)
+    except (OSError, struct.error):
+        pass
+    return None
+
+
+class ImageFileInfo(object):
+    def __init__(self, name, size, mtime, dimensions):
+        """
+        Information about an image in the slideshow folder
+
+        :param name:       File name of the image
+        :param size:       Size of the file in bytes
+        :param mtime:      Modification time of the file in nanoseconds
+        :param dimensions: Width and height of the image or None if unknown
+        """
+        self.name       = name
+        self.size       = size
+        self.mtime      = mtime
+        self.dimensions = dimensions
+
+
+class SlideshowIndex(object):
+    def __init__(self, path="", sort_alphabetically=True, logger=None):
+        """
+        Index of the images in the slideshow folder. The folder is read with scandir and only added, removed or
+        modified files are processed on a refresh. The play order and the position in it are kept over refreshes,
+        new images are inserted at their sorted position or, if shuffled, at a random position not yet shown.
+
+        :param path:                Folder of the images
+        :param sort_alphabetically: Play the images sorted by their name, otherwise shuffled
+        :param logger:              Logger to report the changes of the folder
+        """
+        self.path                = path
+        self.sort_alphabetically = sort_alphabetically
+        self.logger              = logger
+
+        self._entries  = dict()
+        self._order    = []
+        self._position = 0
+
+    @property
+    def position(self):
+        """
+        Index of the next image to show in the play order
+        """
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        self._position = value % len(self._order) if self._order else 0
+
+    def __len__(self):
+        return len(self._order)
+
+    def get_paths(self):
+        """
+        Return the full paths of all images in play order
+        """
+        return [os.path.join(self.path, name) for name in self._order]
+
+    def set_path(self, path):
+        """
+        Change the folder and read it. Return True if the index has been changed
+        """
+        if path == self.path and self._entries:
+            return self.refresh()
+
+        self.path      = path
+        self._entries  = dict()
+        self._order    = []
+        self._position = 0
+        return self.refresh()
+
+    def set_sort_alphabetically(self, sort_alphabetically):
+        """
+        Change the play order. Return True if the order has been changed
+        """
+        if sort_alphabetically == self.sort_alphabetically and self._order:
+            return False
+        self.sort_alphabetically = sort_alphabetically
+
+        if sort_alphabetically:
+            # Continue with the image which would have been shown next
+            next_name = self._order[self._position] if self._order else None
+            self._order.sort()
+            self._position = self._order.index(next_name) if next_name is not None else 0
+        else:
+            random.shuffle(self._order)
+            self._position = 0
+        return True
+
+    def refresh(self):
+        """
+        Read the folder and update the index with the added, removed and modified images. Return True if the index
+        has been changed
+        """
+        found = dict()
+        try:
+            with os.scandir(self.path) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith(IMAGE_EXTENSIONS) and entry.is_file():
+                        found[entry.name] = entry.stat()
+        except OSError as e:
+            if self.logger is not None:
+                self.logger.error(f"Could not read slideshow folder '{self.path}'", exception=e.args)
+            return False
+
+        removed  = [name for name in self._entries if name not in found]
+        added    = [name for name in found if name not in self._entries]
+        modified = [name for name, stat in found.items() if name in self._entries and
+                    (self._entries[name].mtime != stat.st_mtime_ns or self._entries[name].size != stat.st_size)]
+
+        if removed:
+            removed_set = set(removed)
+            position = self._position - sum(1 for name in self._order[:self._position] if name in removed_set)
+            self._order = [name for name in self._order if name not in removed_set]
+            for name in removed:
+                del self._entries[name]
+            self.position = position
+
+        for name in added + modified:
+            stat = found[name]
+            self._entries[name] = ImageFileInfo(name       = name,
+                                                size       = stat.st_size,
+                                                mtime      = stat.st_mtime_ns,
+                                                dimensions = get_image_size(os.path.join(self.path, name)))
+
+        for name in sorted(added):
+            if self.sort_alphabetically:
+                index = bisect.bisect(self._order, name)
+            else:
+                # Show the new image in the current round
+                index = random.randint(self._position, len(self._order))
+            self._order.insert(index, name)
+            if index < self._position:
+                self._position += 1
+
+        changed = bool(removed or added or modified)
+        if changed and self.logger is not None:
+            self.logger.info(f"Slideshow folder '{self.path}': {len(added)} added, {len(removed)} removed, "
+                             f"{len(modified)} modified, {len(self._order)} images")
+        return changed
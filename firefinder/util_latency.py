@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+import time
+import threading
+
+from enum import Enum
+from collections import deque
+
+
+class LatencyStage(str, Enum):
+    """
+    Stages an alarm passes from the ini-file being written until it is visible and audible. The order of the
+    enumeration is the expected order of the stages.
+    """
+    file_changed  = "file_changed"   # FileWatch detected the modification time change
+    file_parsed   = "file_parsed"    # ini-file read by the configparser
+    config_done   = "config_done"    # get_screen_config has created the screen configuration
+    queued        = "queued"         # configuration put into the queue of the GuiThread
+    configured    = "configured"     # configure() of the screen finished
+    frame_flipped = "frame_flipped"  # first frame with the new configuration sent to the display
+    sound_started = "sound_started"  # alarm sound started playing
+    cec_power_on  = "cec_power_on"   # power on command sent to the television
+
+
+class LatencyTracker(object):
+    def __init__(self, history=100, trace_timeout=120, logger=None):
+        """
+        Measure the time from the modification of the alarm file to each of the LatencyStage's. For every stage
+        the last 'history' measurements are kept to calculate the p50, p95 and maximum latency.
+
+        :param history:       Amount of measurements stored per stage
+        :param trace_timeout: Time in seconds after which stages are no longer assigned to the current alarm
+        :param logger:        Logger instance, nothing is logged as long as it is None
+        """
+        self.logger        = logger
+        self.trace_timeout = trace_timeout
+
+        self._lock         = threading.Lock()
+        self._history      = {stage: deque(maxlen=history) for stage in LatencyStage}
+        self._trace_start  = None
+        self._trace_stages = dict()
+
+    def begin(self, written_at=None):
+        """
+        Start measuring a new alarm. All following stages are measured relative to this point in time
+
+        :param written_at: Modification time of the alarm file (seconds since the epoch). If given, the time the
+                           file watcher needed to detect the change is part of the measurement as well.
+        """
+        now = time.monotonic()
+        if written_at is not None:
+            now -= max(time.time() - written_at, 0)
+
+        with self._lock:
+            self._trace_start = now
+            self._trace_stages = dict()
+
+    def mark(self, stage: LatencyStage):
+        """
+        Record the time elapsed since the begin of the current alarm for the given stage. Every stage is only
+        recorded once per alarm, further calls are ignored as well as calls without a running measurement.
+        """
+        with self._lock:
+            if self._trace_start is None or stage in self._trace_stages:
+                return
+
+            elapsed = time.monotonic() - self._trace_start
+            if elapsed > self.trace_timeout:
+                self._trace_start = None
+                return
+
+            self._trace_stages[stage] = elapsed
+            self._history[stage].append(elapsed)
+            trace_stages = dict(self._trace_stages)
+
+        if self.logger is not None:
+            self.logger.debug(f"Alarm latency '{stage.value}' reached after {elapsed * 1000:.0f} ms")
+
+            # As soon as the alarm is visible, report the whole chain up to this point
+            if stage == LatencyStage.frame_flipped:
+                summary = ", ".join(f"{s.value}={t * 1000:.0f}ms" for s, t in trace_stages.items())
+                self.logger.info(f"Alarm latency: {summary}")
+                self.log_statistics()
+
+    @staticmethod
+    def _percentile(sorted_values, percent):
+        index = min(int(round(percent / 100 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+        return sorted_values[index]
+
+    def get_statistics(self):
+        """
+        Return a dictionary with the count, p50, p95 and max latency in seconds for every stage measured so far
+        """
+        statistics = dict()
+        with self._lock:
+            for stage, values in self._history.items():
+                if values:
+                    sorted_values = sorted(values)
+                    statistics[stage.value] = {"count": len(sorted_values),
+                                               "p50":   self._percentile(sorted_values, 50),
+                                               "p95":   self._percentile(sorted_values, 95),
+                                               "max":   sorted_values[-1]}
+        return statistics
+
+    def log_statistics(self):
+        if self.logger is None:
+            return
+
+        for stage, values in self.get_statistics().items():
+            self.logger.info(f"Alarm latency '{stage}' over {values['count']} alarms: p50={values['p50'] * 1000:.0f}ms "
+                             f"p95={values['p95'] * 1000:.0f}ms max={values['max'] * 1000:.0f}ms")
+
+
+# Shared instance, the stages are reached in different threads and modules
+latency_tracker = LatencyTracker()
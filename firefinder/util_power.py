@@ -13,6 +13,7 @@ from enum import Enum
 from celery import Task
 from threading import Timer
 from firefinder.util_logger import Logger
+from firefinder.util_latency import latency_tracker, LatencyStage
 
 
 class OutputState(Enum):
@@ -363,6 +364,7 @@ class GraphicOutputDriver(object):
                 # Always enable TV. The user could switch of TV manually
                 self.logger.info("Switch TV on")
                 self.tv_obj.run(True)
+                latency_tracker.mark(LatencyStage.cec_power_on)
         else:
             '''
             ORDER:
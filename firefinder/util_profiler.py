@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+import time
+import pygame
+import functools
+
+from collections import deque
+from contextlib import contextmanager
+
+
+class FrameProfiler(object):
+    def __init__(self, history=300, frame_budget=1 / 30, dump_interval=60, logger=None):
+        """
+        Measure the time spent in the components of a frame (update of the surfaces, blit and flip). For every
+        component the last 'history' measurements are kept. Disabled by default, so it does not cost anything in
+        normal operation.
+
+        :param history:       Amount of measurements stored per component
+        :param frame_budget:  Time in seconds available for a frame, components exceeding it are highlighted
+        :param dump_interval: Time in seconds between two dumps of the statistics to the log, 0 to disable
+        :param logger:        Logger instance, nothing is logged as long as it is None
+        """
+        self.logger        = logger
+        self.enabled       = False
+        self.show_overlay  = False
+        self.history       = history
+        self.frame_budget  = frame_budget
+        self.dump_interval = dump_interval
+
+        self._stats     = dict()
+        self._last_dump = time.monotonic()
+
+    def configure(self, enable=None, show_overlay=None, dump_interval=None, frame_budget=None):
+        if enable is not None:
+            self.enabled = enable
+        if show_overlay is not None:
+            self.show_overlay = show_overlay
+            if show_overlay:
+                # The overlay is useless without measurements
+                self.enabled = True
+        if dump_interval is not None:
+            self.dump_interval = dump_interval
+        if frame_budget is not None:
+            self.frame_budget = frame_budget
+
+    def toggle_overlay(self):
+        self.configure(show_overlay=not self.show_overlay)
+
+    def record(self, name, duration):
+        values = self._stats.get(name)
+        if values is None:
+            values = deque(maxlen=self.history)
+            self._stats[name] = values
+        values.append(duration)
+
+    @contextmanager
+    def measure(self, name):
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def reset(self):
+        self._stats = dict()
+
+    def get_statistics(self):
+        """
+        Return a dictionary with the count, average, p95 and max time in seconds for every measured component
+        """
+        statistics = dict()
+        for name, values in list(self._stats.items()):
+            sorted_values = sorted(values)
+            if sorted_values:
+                p95_index = min(int(round(0.95 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+                statistics[name] = {"count": len(sorted_values),
+                                    "avg":   sum(sorted_values) / len(sorted_values),
+                                    "p95":   sorted_values[p95_index],
+                                    "max":   sorted_values[-1]}
+        return statistics
+
+    def _get_report_lines(self):
+        statistics = self.get_statistics()
+        names = sorted(statistics, key=lambda n: statistics[n]["avg"], reverse=True)
+
+        lines = []
+        for name in names:
+            values = statistics[name]
+            lines.append((f"{name:<34} avg {values['avg'] * 1000:6.2f}ms  p95 {values['p95'] * 1000:6.2f}ms  "
+                          f"max {values['max'] * 1000:6.2f}ms", values["max"] > self.frame_budget))
+        return lines
+
+    def dump(self):
+        if self.logger is None:
+            return
+
+        self.logger.info(f"Frame profile, budget {self.frame_budget * 1000:.1f}ms per frame")
+        for line, over_budget in self._get_report_lines():
+            if over_budget:
+                self.logger.warning(line)
+            else:
+                self.logger.info(line)
+
+    def dump_if_due(self):
+        if not self.enabled or not self.dump_interval:
+            return
+
+        if time.monotonic() - self._last_dump >= self.dump_interval:
+            self._last_dump = time.monotonic()
+            self.dump()
+
+    def draw_overlay(self, surface: pygame.Surface, font: pygame.font.Font, max_lines=15):
+        """
+        Draw the statistics of the slowest components on the top left corner of the surface
+
+        :return: Area of the surface which has been drawn
+        """
+        lines = [(f"Frame budget {self.frame_budget * 1000:.1f}ms", False)] + self._get_report_lines()[:max_lines]
+
+        line_height = font.get_linesize()
+        width = max(font.size(line)[0] for line, _ in lines) + 10
+        rect = pygame.Rect(0, 0, width, line_height * len(lines) + 10)
+
+        surface.fill((0, 0, 0), rect)
+        for i, (line, over_budget) in enumerate(lines):
+            color = (255, 0, 0) if over_budget else (0, 255, 0)
+            surface.blit(font.render(line, True, color), (5, 5 + i * line_height))
+
+        return rect.clip(surface.get_rect())
+
+
+# Shared instance, the surfaces are measured wherever they are used
+profiler = FrameProfiler()
+
+
+def profiled(func):
+    """
+    Decorator to measure a method with the profiler, the component is named after the class and the method
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not profiler.enabled:
+            return func(self, *args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            profiler.record(f"{self.__class__.__name__}.{func.__name__}", time.perf_counter() - start)
+    return wrapper
@@ -3,19 +3,28 @@
 import os
 import re
 import math
+import bisect
 import time
 import queue
-import random
 import pygame
 import pathlib
 import threading
+import concurrent.futures
 
 from enum import Enum
 from typing import Union
+from collections import OrderedDict
 from datetime import datetime
 from firefinder.util_power import GraphicOutputDriver, OutputState
 from firefinder.util_logger import Logger
 from firefinder.util_sound import AlarmSound
+from firefinder.util_latency import latency_tracker, LatencyStage
+from firefinder.util_profiler import profiler, profiled
+from firefinder.util_font import get_font_obj, render_text, font_registry, text_cache
+from firefinder.util_tick import tick_service, TickUnit
+from firefinder.util_image import (load_image, convert_for_display, image_cache, gradient_cache, get_gradient,
+                                   get_image_atlas, ImagePrefetcher, DiskImageCache, SlideshowIndex, DISK_CACHE_DIR,
+                                   set_image_decoder, get_image_decoder)
 
 pygame.init()
 pygame.display.set_caption("FireFinder")
@@ -29,12 +38,21 @@ BLUE  = (0, 0, 255)
 WHITE = (255, 255, 255)
 
 FPS = 30
+EVENT_POLL_INTERVAL = 0.1  # Maximum time in seconds the GuiThread sleeps without checking the user input
+FADE_DURATION = 1.0  # Time in seconds to fade from the old to the new image, doubled if faded over the background
+ASSET_LOADER_WORKERS = 3  # Threads to load the images and the response order of an alarm in parallel
+ASSET_LOAD_TIMEOUT = 5  # Time in seconds after which a still loading image or response order of an alarm is logged
+ASSET_FIRST_FRAME_WAIT = 0.02  # Time in seconds an alarm waits for its assets before the first frame is shown
+SLIDESHOW_REFRESH_INTERVAL = 300  # Time in seconds between two checks of the slideshow folder for changed images
+TEXT_TILE_WIDTH = 1024  # Maximum width in pixel of the pieces a long scrolling text is rendered in
+TEXT_TILE_CACHE_AMOUNT = 8  # Rendered pieces of a long scrolling text kept in memory, the visible ones are needed
 
 THIS_FILE_PATH = os.path.dirname(__file__)
 DEFAULT_FONT = os.path.join(THIS_FILE_PATH, "font", "Frutiger.ttf")
 DEFAULT_FONT_BOLD = os.path.join(THIS_FILE_PATH, "font", "Frutiger_bold.ttf")
 DEFAULT_PIC_DIR = os.path.join(THIS_FILE_PATH, "pic")
 DEFAULT_NO_PIC = os.path.join(THIS_FILE_PATH, "pic", "bg", "no_image.png")
+EQUIPMENT_PIC_PATTERN = "Fz_*"  # Pictures of the vehicles in DEFAULT_PIC_DIR, they are kept ready for the response order
 DEFAULT_SOUND_DIR = os.path.join(THIS_FILE_PATH, "sound")
 
 CASE_LEVEL_DICT = {
@@ -85,51 +103,6 @@ CASE_COLOR_DICT = {
 }
 
 
-def scale_image(image_obj, max_width=None, max_height=None, crop=False, keep_ratio=True):
-    # Get the original image dimensions
-    width, height = image_obj.get_size()
-
-    # Determine the scaling factor for width and height
-    width_scale = float(max_width) / width if max_width else 1.0
-    height_scale = float(max_height) / height if max_height else 1.0
-
-    # Determine the scaling factor to use based on the largest dimension
-    if crop:
-        # Crop the image if necessary to fit within the given dimensions
-        scale_factor = max(width_scale, height_scale)
-    else:
-        # Scale the image down proportionally to fit within the given dimensions
-        scale_factor = min(width_scale, height_scale)
-
-    # Calculate the new image size after scaling
-    new_width = int(width * scale_factor)
-    new_height = int(height * scale_factor)
-
-    # Scale the image using the new dimensions
-    try:
-        scaled_image = pygame.transform.smoothscale(image_obj, (new_width, new_height))
-    except ValueError:
-        scaled_image = pygame.transform.scale(image_obj, (new_width, new_height))
-
-    if crop:
-        # If cropping, create a new surface with the target dimensions and blit the scaled image onto it
-        target_surface = pygame.Surface((max_width, max_height))
-        target_surface.blit(scaled_image, ((max_width - new_width) // 2, (max_height - new_height) // 2))
-        return target_surface
-    else:
-        # If scaling, return the scaled image directly
-        return scaled_image
-
-
-def get_font_obj(font_name, font_size):
-    # Check if font name is installed or is it a font-file
-    if ".ttf" in font_name:
-        font = pygame.font.Font(font_name, int(font_size))
-    else:
-        font = pygame.font.SysFont(font_name, int(font_size))
-    return font
-
-
 def get_screen_obj_from_string(screen_name: str):
     screen_name = screen_name.lower()
     if screen_name == "event":
@@ -241,20 +214,104 @@ class EventInfo(object):
 
 
 # ---- SURFACES ---------------------------
-class HeaderSurface(pygame.Surface):
+class BaseSurface(pygame.Surface):
+    """
+    Base class for all surfaces and screens. Every area which is redrawn within 'update' is marked as dirty,
+    so the parent surface (or at the end the GuiThread) only has to copy and show the changed areas instead
+    of the whole surface.
+    """
+    def __init__(self, size):
+        super(BaseSurface, self).__init__(size)
+        self._dirty_rects = []
+
+    def mark_dirty(self, rect=None):
+        """
+        Mark an area of this surface as changed
+
+        :param rect: Changed area in coordinates of this surface. If None, the whole surface is marked
+        """
+        if rect is None:
+            rect = self.get_rect()
+        self._dirty_rects.append(pygame.Rect(rect))
+
+    def get_dirty_rects(self):
+        """
+        Return all areas changed since the last call and reset the list afterwards
+        """
+        dirty_rects = self._dirty_rects
+        self._dirty_rects = []
+        return dirty_rects
+
+    def get_next_frame_delay(self):
+        """
+        Return the time in seconds until this surface needs to be updated again. 0 means the surface is animated
+        and shall be updated with every frame, None means it never changes by itself.
+        """
+        return 0
+
+    def blit_dirty(self, surface, dest):
+        """
+        Copy only the changed areas of a child surface to this surface and take over its dirty areas
+
+        :param surface: Child surface, must be an instance of BaseSurface
+        :param dest:    Position of the child surface on this surface
+        """
+        for rect in surface.get_dirty_rects():
+            self.blit(surface, rect.move(dest), rect)
+            self.mark_dirty(rect.move(dest))
+
+
+class TimeSurface(BaseSurface):
+    """
+    Base class for surfaces showing the time. The surface is informed by the tick service and only has to redraw
+    if the time it shows has changed, which is flagged by _time_changed. The smallest unit of the shown time
+    follows from show_time, show_second and show_date, subclasses showing the time differently override
+    _get_tick_unit().
+    """
+    def __init__(self, size, show_time=False, show_second=False, show_date=False):
+        super(TimeSurface, self).__init__(size)
+        self.show_time   = show_time
+        self.show_second = show_second  # show_time must be True
+        self.show_date   = show_date
+
+        self._time_changed = True
+        tick_service.subscribe(self._on_tick)
+
+    def _get_tick_unit(self):
+        """
+        Return the smallest unit of the shown time, None if no time is shown
+        """
+        if self.show_time and self.show_second:
+            return TickUnit.second
+        elif self.show_time:
+            return TickUnit.minute
+        elif self.show_date:
+            return TickUnit.date
+        return None
+
+    def _on_tick(self, unit, now):
+        tick_unit = self._get_tick_unit()
+        if tick_unit is not None and unit >= tick_unit:
+            self._time_changed = True
+
+    def get_next_frame_delay(self):
+        tick_unit = self._get_tick_unit()
+        if tick_unit is None:
+            return None
+        return tick_service.get_next_tick_delay(tick_unit)
+
+
+class HeaderSurface(TimeSurface):
     def __init__(self, size, logger=None, color_bg=BLACK, color_fg=WHITE, show_time=True, show_second=True,
                  show_date=True, show_weekday=True, show_logo=True, company_path_logo="", company_name=""):
-        super(HeaderSurface, self).__init__(size)
+        super(HeaderSurface, self).__init__(size, show_time=show_time, show_second=show_second, show_date=show_date)
         self.logger = logger if logger is not None else Logger(verbose=True, file_path=".\\HeaderSurface.log")
 
-        self._font = get_font_obj(font_name=DEFAULT_FONT_BOLD, font_size=self.get_height()-4)
+        self._font_size = self.get_height() - 4
 
         self.bg_color = color_bg
         self.fg_color = color_fg
 
-        self.show_time    = show_time
-        self.show_second  = show_second
-        self.show_date    = show_date
         self.show_weekday = show_weekday
         self.weekday_list = ['Montag',      # Weekday 0
                              'Dienstag',    # Weekday 1
@@ -271,8 +328,13 @@ class HeaderSurface(pygame.Surface):
 
         self.image = self._get_logo_surface()
 
+        # Background, logo and company name are drawn once into a layer, only the date and time change
+        self._static_layer     = None
+        self._time_date_string = None
+        self._time_date_rect   = None
+
     def _get_date_time_str(self):
-        act_time = datetime.timetuple(datetime.now())
+        act_time = datetime.timetuple(tick_service.now())
         year, month, day, h, m, s, wd, x, x = act_time
 
         time_string = "{:02d}:{:02d}".format(h, m)
@@ -296,11 +358,8 @@ class HeaderSurface(pygame.Surface):
     def _get_logo_surface(self):
         image = None
         if os.path.isfile(self.company_path_logo):
-            # Load image
-            image = pygame.image.load(self.company_path_logo)
-
             # The image shall be 4 pixel smaller than the available space
-            image = scale_image(image_obj=image, max_height=self.get_height() - 4)
+            image = load_image(self.company_path_logo, max_height=self.get_height() - 4)
 
         return image
 
@@ -335,26 +394,22 @@ class HeaderSurface(pygame.Surface):
                 self.company_name = value
                 self.logger.info("Set 'company_name' to {}".format(value))
 
-    def update(self):
-
-        self.fill(self.bg_color)
-
-        # Render text for date and time
-        time_date_string = self._get_date_time_str()
-        text_date_time = self._font.render(time_date_string, True, self.fg_color, self.bg_color)
+        # The settings change the look of the header, draw it again with the next update
+        self._static_layer = None
 
-        # blit text on the right position of the header
-        text_rect = text_date_time.get_rect()
-        text_rect.right = self.get_width() - 10
-        text_rect.centery = self.get_height() // 2
-        self.blit(text_date_time, text_rect)
+    def _build_static_layer(self):
+        """
+        Draw the background, the logo and the company name, which only change with a configuration, into a layer
+        """
+        layer = convert_for_display(pygame.Surface(self.get_size()))
+        layer.fill(self.bg_color)
 
         if self.show_logo and self.image is not None:
             # Blit the image on the left position of the header
             image_rect = self.image.get_rect()
             image_rect.left = 10
             image_rect.centery = self.get_height() // 2
-            self.blit(self.image, image_rect)
+            layer.blit(self.image, image_rect)
 
         if self.company_name:
             image_width = 0
@@ -363,14 +418,53 @@ class HeaderSurface(pygame.Surface):
                 image_width = image_rect.right + 10
 
             # blit text on the right position of the company logo
-            text_company = self._font.render(self.company_name, True, self.fg_color, self.bg_color)
+            text_company = render_text(self.company_name, DEFAULT_FONT_BOLD, self._font_size, self.fg_color, self.bg_color)
             text_rect = text_company.get_rect()
             text_rect.left = image_width + 10
             text_rect.centery = self.get_height() // 2
-            self.blit(text_company, text_rect)
+            layer.blit(text_company, text_rect)
 
+        self._static_layer = layer
 
-class AnalogClockSurface(pygame.Surface):
+    @profiled
+    def update(self):
+        # After a configuration the whole header is drawn again, otherwise only the date and time
+        if self._static_layer is None:
+            self._build_static_layer()
+            self.blit(self._static_layer, (0, 0))
+            self.mark_dirty()
+            self._time_date_string = None
+            self._time_date_rect = None
+            self._time_changed = True
+
+        # Render text for date and time, but only if it has changed since the last frame
+        if not self._time_changed:
+            return
+        self._time_changed = False
+        time_date_string = self._get_date_time_str()
+        if time_date_string == self._time_date_string:
+            return
+        self._time_date_string = time_date_string
+        # The time is shown only once, do not let it replace the reused texts in the shared text cache
+        font = get_font_obj(font_name=DEFAULT_FONT_BOLD, font_size=self._font_size)
+        text_date_time = font.render(time_date_string, True, self.fg_color, self.bg_color)
+
+        # Remove the last text, the new one may be shorter
+        dirty_rect = self._time_date_rect
+        if dirty_rect is not None:
+            self.blit(self._static_layer, dirty_rect, dirty_rect)
+
+        # blit text on the right position of the header
+        text_rect = text_date_time.get_rect()
+        text_rect.right = self.get_width() - 10
+        text_rect.centery = self.get_height() // 2
+        self.blit(text_date_time, text_rect)
+
+        self._time_date_rect = text_rect.clip(self.get_rect())
+        self.mark_dirty(self._time_date_rect if dirty_rect is None else dirty_rect.union(self._time_date_rect))
+
+
+class AnalogClockSurface(TimeSurface):
     def __init__(self, size, logger=None, **kwargs):
         super(AnalogClockSurface, self).__init__(size)
         self.logger = logger if logger is not None else Logger(verbose=True, file_path=".\\AnalogClockSurface.log")
@@ -403,55 +497,88 @@ class AnalogClockSurface(pygame.Surface):
         self.show_minute_hand = kwargs.get("show_minute_hand", True)
         self.show_hour_hand   = kwargs.get("show_hour_hand", True)
 
-    def draw_clock_face(self):
-        for i in range(12):
-            angle = 2 * math.pi * i / 12 - math.pi / 2
-            x = self.center[0] + self.radius * math.cos(angle)
-            y = self.center[1] + self.radius * math.sin(angle)
-            pygame.draw.circle(self, self.color_face, (int(x), int(y)), self.circle_size, 0)
+        # The dial is drawn once into a layer and rebuilt if its size or colors change
+        self._dial     = None
+        self._dial_key = None
+        self._build_hand_positions()
 
-        # Draw center point where all hands come together
-        pygame.draw.circle(self, self.color_face, self.center, self.circle_size, 0)
+    def _get_tick_unit(self):
+        # The hands show the time instead of show_time, show_second and show_date
+        if self.show_second_hand:
+            return TickUnit.second
+        elif self.show_minute_hand or self.show_hour_hand:
+            return TickUnit.minute
+        return None
+
+    def _get_hand_positions(self, length, amount):
+        """
+        Return the end points of a hand for all its positions, starting at 12 o'clock and going clockwise
+        """
+        positions = []
+        for i in range(amount):
+            angle = 2 * math.pi * i / amount - math.pi / 2
+            positions.append((self.center[0] + length * math.cos(angle), self.center[1] + length * math.sin(angle)))
+        return positions
+
+    def _build_hand_positions(self):
+        # The hands only stop at these positions, so their end points are calculated only once
+        self._second_positions = self._get_hand_positions(self.second_hand_length, 60)
+        self._minute_positions = self._get_hand_positions(self.minute_hand_length, 60)
+        self._hour_positions   = self._get_hand_positions(self.hour_hand_length, 12 * 60)
+
+    def _build_dial(self):
+        """
+        Draw the background, the face markers and the border, which do not change with the time, into a layer
+        """
+        dial = convert_for_display(pygame.Surface(self.get_size()))
+        dial.fill(self.color_bg)
+        for x, y in self._get_hand_positions(self.radius, 12):
+            pygame.draw.circle(dial, self.color_face, (int(x), int(y)), self.circle_size, 0)
 
         # Show a circle clock boarder if size greater than 0
         if self.clock_boarder > 0:
-            pygame.draw.circle(self, self.color_boarder, self.center, self.radius + self.circle_size*2, self.clock_boarder)
+            pygame.draw.circle(dial, self.color_boarder, self.center, self.radius + self.circle_size*2,
+                               self.clock_boarder)
+
+        self._dial = dial
+        self._dial_key = self._get_dial_key()
+
+    def _get_dial_key(self):
+        return self.get_size(), self.color_bg, self.color_face, self.color_boarder, self.clock_boarder
+
+    def draw_clock_face(self):
+        if self._dial is None or self._dial_key != self._get_dial_key():
+            self._build_dial()
+        self.blit(self._dial, (0, 0))
 
     def draw_hour_hand(self, current_time):
         width = int(self.hour_hand_width)
-        hour, minute = current_time.hour % 12, current_time.minute
-
-        angle = 2 * math.pi * (hour / 12 + minute / (60 * 12)) - math.pi / 2
-        x = self.center[0] + self.hour_hand_length * math.cos(angle)
-        y = self.center[1] + self.hour_hand_length * math.sin(angle)
-        pygame.draw.line(self, self.color_hour_hand, self.center, (x, y), width)
+        position = self._hour_positions[(current_time.hour % 12) * 60 + current_time.minute]
+        pygame.draw.line(self, self.color_hour_hand, self.center, position, width)
 
     def draw_minute_hand(self, current_time):
         width = int(self.minute_hand_width)
-        angle = 2 * math.pi * (current_time.minute / 60 + current_time.second / (60 * 60)) - math.pi / 2
+        position = self._minute_positions[current_time.minute]
+        pygame.draw.line(self, self.color_minute_hand, self.center, position, width)
 
-        x = self.center[0] + self.minute_hand_length * math.cos(angle)
-        y = self.center[1] + self.minute_hand_length * math.sin(angle)
-        pygame.draw.line(self, self.color_minute_hand, self.center, (x, y), width)
-
-    def draw_second_hand(self, ticks):
+    def draw_second_hand(self, current_time):
         width = int(self.second_hand_width)
-        seconds = ticks / 1000 % 60
-        angle = math.radians((seconds / 60) * 360 - 90)
-
-        x = self.center[0] + self.second_hand_length * math.cos(angle)
-        y = self.center[1] + self.second_hand_length * math.sin(angle)
-        pygame.draw.line(self, self.color_second_hand, self.center, (x, y), width)
+        position = self._second_positions[current_time.second]
+        pygame.draw.line(self, self.color_second_hand, self.center, position, width)
 
-        pygame.draw.circle(self, self.color_second_hand, (x, y), self.circle_size/2, 0)
+        pygame.draw.circle(self, self.color_second_hand, position, self.circle_size/2, 0)
 
+    @profiled
     def update(self):
-        # Clear the surface
-        self.fill(self.color_bg)
-
-        # Get current time and ticks
-        current_time = datetime.now()
-        ticks = pygame.time.get_ticks()
+        # The hands only move with a tick of the shown time
+        if not self._time_changed and self._dial_key == self._get_dial_key():
+            return
+        self._time_changed = False
+        current_time = tick_service.now()
+
+        # Restore the dial, only the hands are drawn
+        rebuild_dial = self._dial is None or self._dial_key != self._get_dial_key()
+        self.draw_clock_face()
 
         if self.show_hour_hand:
             self.draw_hour_hand(current_time=current_time)
@@ -460,9 +587,18 @@ class AnalogClockSurface(pygame.Surface):
             self.draw_minute_hand(current_time=current_time)
 
         if self.show_second_hand:
-            self.draw_second_hand(ticks=ticks)
+            self.draw_second_hand(current_time=current_time)
 
-        self.draw_clock_face()
+        # Draw center point where all hands come together
+        pygame.draw.circle(self, self.color_face, self.center, self.circle_size, 0)
+        if rebuild_dial:
+            self.mark_dirty()
+        else:
+            # The hands never leave the clock border
+            size = 2 * (self.radius + self.circle_size * 2 + self.clock_boarder)
+            dial_rect = pygame.Rect(0, 0, size, size)
+            dial_rect.center = self.center
+            self.mark_dirty(dial_rect.clip(self.get_rect()))
 
     def configure(self, **kw):
 
@@ -475,18 +611,23 @@ class AnalogClockSurface(pygame.Surface):
             for key, value in list(kw.items()):
                 if key == 'show_second_hand':
                     self.show_second_hand = value
+                    self._time_changed = True
                     self.logger.info("Set 'show_second_hand' to {}".format(value))
                 elif key == 'show_minute_hand':
                     self.show_minute_hand = value
+                    self._time_changed = True
                     self.logger.info("Set 'show_minute_hand' to {}".format(value))
                 elif key == 'show_hour_hand':
                     self.show_hour_hand = value
+                    self._time_changed = True
                     self.logger.info("Set 'show_hour_hand' to {}".format(value))
 
 
-class DigitalClockSurface(pygame.Surface):
+class DigitalClockSurface(TimeSurface):
     def __init__(self, size, logger=None, **kwargs):
-        super(DigitalClockSurface, self).__init__(size)
+        super(DigitalClockSurface, self).__init__(size, show_time=kwargs.get("show_time", False),
+                                                  show_second=kwargs.get("show_second", False),
+                                                  show_date=kwargs.get("show_date", True))
         self.logger = logger if logger is not None else Logger(verbose=True, file_path=".\\DigitalClockSurface.log")
 
         # Size of the analog clock
@@ -496,13 +637,7 @@ class DigitalClockSurface(pygame.Surface):
         self.color_bg = kwargs.get("color_bg", BLACK)
         self.color_fg = kwargs.get("color_fg", WHITE)
 
-        # Define which hands shall be shown
-        self.show_time   = kwargs.get("show_time", False)
-        self.show_date   = kwargs.get("show_date", True)
-        self.show_second = kwargs.get("show_second", False)  # show_time must be True
-
-        font_size = int(self.get_height() * 0.6)
-        self._font = get_font_obj(font_name=DEFAULT_FONT_BOLD, font_size=font_size)
+        self._font_size = int(self.get_height() * 0.6)
         self.weekday_string = ['Montag',      # Weekday 0
                                'Dienstag',    # Weekday 1
                                'Mittwoch',    # Weekday 2
@@ -511,10 +646,14 @@ class DigitalClockSurface(pygame.Surface):
                                'Samstag',     # Weekday 5
                                'Sonntag']     # Weekday 6
 
+    @profiled
     def update(self):
+        if not self._time_changed:
+            return
+        self._time_changed = False
         self.fill(self.color_bg)
 
-        current_time = datetime.now()
+        current_time = tick_service.now()
         time_str = "{:02d}:{:02d}".format(current_time.hour, current_time.minute)
         if self.show_second:
             time_str = "{}:{:02d}".format(time_str, current_time.second)
@@ -523,8 +662,10 @@ class DigitalClockSurface(pygame.Surface):
         if not self.show_time:
             date_str = "{}, {}".format(self.weekday_string[current_time.weekday()], date_str)
 
-        time_txt = self._font.render(time_str, True, self.color_fg, self.color_bg)
-        date_txt = self._font.render(date_str, True, self.color_fg, self.color_bg)
+        # The time is shown only once, do not let it replace the reused texts in the shared text cache
+        font = get_font_obj(font_name=DEFAULT_FONT_BOLD, font_size=self._font_size)
+        time_txt = font.render(time_str, True, self.color_fg, self.color_bg)
+        date_txt = render_text(date_str, DEFAULT_FONT_BOLD, self._font_size, self.color_fg, self.color_bg)
         if self.show_time and self.show_date:
             text_rect = time_txt.get_rect()
             text_rect.left    = 10
@@ -548,6 +689,8 @@ class DigitalClockSurface(pygame.Surface):
             text_rect.centery = self.get_height() // 2
             self.blit(date_txt, text_rect)
 
+        self.mark_dirty()
+
     def configure(self, **kw):
 
         if len(kw) == 0:  # return a dict of the current configuration
@@ -559,15 +702,28 @@ class DigitalClockSurface(pygame.Surface):
             for key, value in list(kw.items()):
                 if key == 'show_time':
                     self.show_time = value
+                    self._time_changed = True
                     self.logger.info("Set 'show_time' to {}".format(value))
                 elif key == 'show_date':
                     self.show_date = value
+                    self._time_changed = True
                     self.logger.info("Set 'show_date' to {}".format(value))
                 elif key == 'show_second':
                     self.show_second = value
+                    self._time_changed = True
                     self.logger.info("Set 'show_second' to {}".format(value))
 
 
+def blit_clipped(surface, image, pos, viewport):
+    """
+    Blit only the part of the image at the given position which lies within the viewport
+    """
+    image_rect = image.get_rect(topleft=pos)
+    visible_rect = image_rect.clip(viewport)
+    if visible_rect.width and visible_rect.height:
+        surface.blit(image, visible_rect, visible_rect.move(-image_rect.left, -image_rect.top))
+
+
 class ScrollingTextX(object):
     def __init__(self, text, font_size, font_color, font=None):
         super(ScrollingTextX, self).__init__()
@@ -578,19 +734,64 @@ class ScrollingTextX(object):
         self.scroll_speed_base = 9
         self.scroll_speed = self.scroll_speed_base
 
-        self.image = None
         self.rect = None
         self.font = None
         self.font_size = font_size
 
+        # A long text is laid out in tiles of whole words, only the visible tiles are rendered and kept in the cache
+        self._tiles = []             # Text of every tile
+        self._tile_positions = []    # Left side of every tile within the whole text
+        self._tile_widths = []
+        self._tile_cache = OrderedDict()
+
         # Use update_font to change font during runtime
         self._fontname = DEFAULT_FONT_BOLD if font is None else font
         self.update_font(self._fontname, self.font_size)
 
     def render(self):
-        self.image = self.font.render(self._text, True, self.font_color)
-        self.rect = self.image.get_rect()
-        self.rect.left = 0
+        """
+        Lay out the text in tiles, the tiles are rendered as soon as they become visible
+        """
+        self._tiles = []
+        self._tile_positions = []
+        self._tile_widths = []
+        self._tile_cache = OrderedDict()
+
+        tile_text = ""
+        tile_width = 0
+        position = 0
+        for word in re.findall(r"\S+\s*|\s+", self._text):
+            word_width = self.font.size(word)[0]
+            if tile_text and tile_width + word_width > TEXT_TILE_WIDTH:
+                self._add_tile(tile_text, position)
+                position += self._tile_widths[-1]
+                tile_text = ""
+                tile_width = 0
+            tile_text += word
+            tile_width += word_width
+        self._add_tile(tile_text, position)
+
+        self.rect = pygame.Rect(0, 0, position + self._tile_widths[-1], self.font.get_height())
+
+    def _add_tile(self, text, position):
+        self._tiles.append(text)
+        self._tile_positions.append(position)
+        self._tile_widths.append(self.font.size(text)[0])
+
+    def _get_tile(self, index):
+        if len(self._tiles) == 1:
+            # Short texts are shared with all other surfaces showing the same text
+            return render_text(self._tiles[0], self._fontname, self.font_size, self.font_color)
+
+        tile = self._tile_cache.get(index)
+        if tile is None:
+            tile = self.font.render(self._tiles[index], True, self.font_color)
+            self._tile_cache[index] = tile
+            if len(self._tile_cache) > TEXT_TILE_CACHE_AMOUNT:
+                self._tile_cache.popitem(last=False)
+        else:
+            self._tile_cache.move_to_end(index)
+        return tile
 
     def update_text(self, text):
         if self._text != text:
@@ -609,15 +810,31 @@ class ScrollingTextX(object):
         self.render()
 
     def get_rect(self):
-        return self.image.get_rect()
+        return pygame.Rect(0, 0, self.rect.width, self.rect.height)
+
+    def get_viewport(self, surface, x, y):
+        """
+        Return the area of the surface the text is drawn into at the given position
+        """
+        return pygame.Rect(0, y, surface.get_width(), self.rect.height)
+
+    def is_scrolling(self, surface):
+        return self.rect.width > surface.get_width()
 
+    @profiled
     def draw(self, surface: pygame.Surface, x, y):
 
-        rect = self.rect.move(x, y)
-        surface.blit(self.image, rect)
+        # Only the tiles within the visible part of the text are rendered and copied
+        viewport = self.get_viewport(surface, x, y)
+        left = self.rect.left + x
+        index = max(bisect.bisect_right(self._tile_positions, -left) - 1, 0)
+        while index < len(self._tiles) and left + self._tile_positions[index] < surface.get_width():
+            if self._tile_widths[index]:
+                blit_clipped(surface, self._get_tile(index), (left + self._tile_positions[index], y), viewport)
+            index += 1
 
         # Check if the text fit to the screen. If not shift slightly to left for next drawing
-        if self.rect.width > surface.get_width():
+        if self.is_scrolling(surface):
             self.rect.move_ip(-self.scroll_speed, 0)
 
             # Increase speed if right text side is in the middle and reduse speed if left side reaches again the middle
@@ -644,8 +861,8 @@ class ScrollingTextY(object):
         self.scroll_speed_base = 2
         self.scroll_speed = self.scroll_speed_base
 
-        self.image_list = []
-        self.rect_list = []
+        self.image = None  # All lines of the text, rendered once and moved through the visible area
+        self.position = 0  # Top of the text relative to the visible area
         self.font = None
         self.font_size = font_size
 
@@ -656,65 +873,75 @@ class ScrollingTextY(object):
     def render(self):
         font_height = self.font.get_linesize()
 
-        # Split text into words and combine them to lines where each line shall not width than the surface
-        line = ""
+        # Split text into words and combine them to lines where each line shall not width than the surface. Every
+        # distinct word is measured only once, the width of a line is the sum of its words and spaces
+        space_width = self.font.size(" ")[0]
+        word_widths = dict()
         lines = []
-        words = self._text.split()
-        for word in words:
-            if self.font.size(line + word)[0] > self.max_width:
-                lines.append(line)
-                line = ""
-            line += word + " "
-        lines.append(line)
-
-        # Create a text surface for every line
-        self.image_list = []
-        self.rect_list = []
-        for i, line in enumerate(lines):
-            text_surface = self.font.render(line, True, self.font_color)
-            text_rect = text_surface.get_rect()
-            text_rect.topleft = (0, i * font_height)
-            self.image_list.append(text_surface)
-            self.rect_list.append(text_rect)
+        line = []
+        line_width = 0
+        for word in self._text.split():
+            word_width = word_widths.get(word)
+            if word_width is None:
+                word_width = self.font.size(word)[0]
+                word_widths[word] = word_width
+            if line and line_width + space_width + word_width > self.max_width:
+                lines.append(" ".join(line))
+                line = []
+                line_width = 0
+            line_width += word_width + (space_width if line else 0)
+            line.append(word)
+        lines.append(" ".join(line))
 
         self.overall_height = font_height * len(lines)
 
+        # Draw all lines into one transparent surface. The transparent pixels have the font color, so the smooth
+        # edges of the letters keep their color. The lines are only needed for this block, do not cache them
+        self.image = pygame.Surface((self.max_width, max(self.overall_height, 1)), pygame.SRCALPHA)
+        self.image.fill(pygame.Color(self.font_color)[:3] + (0,))
+        for i, line in enumerate(lines):
+            if line:
+                self.image.blit(self.font.render(line, True, self.font_color), (0, i * font_height),
+                                special_flags=pygame.BLEND_RGBA_MAX)
+
+        self.position = 0
+
     def _restart_rect(self):
-        font_height = self.font.get_linesize()
+        # Start again from the bottom
+        self.position = self.max_height
 
-        # Re-arrange images to start from the bottom
-        for i, rect in enumerate(self.rect_list):
-            rect.topleft = (0, i * font_height + self.max_height)
-            self.rect_list[i] = rect
+    def get_viewport(self, surface, x, y):
+        """
+        Return the area of the surface the text is drawn into at the given position
+        """
+        return pygame.Rect(x, y, self.max_width, self.max_height)
 
+    def is_scrolling(self, surface):
+        return self.overall_height > self.max_height
+
+    @profiled
     def draw(self, surface: pygame.Surface, x, y):
+        viewport = self.get_viewport(surface, x, y)
 
         # Only scroll if text is not fitting into surface, otherwise show text middle centered
-        if self.overall_height > self.max_height:
-            for i, (image, rect) in enumerate(zip(self.image_list, self.rect_list)):
-                current_rect = rect.move(x, y)
-                surface.blit(image, current_rect)
+        if self.is_scrolling(surface):
+            blit_clipped(surface, self.image, (x, y + self.position), viewport)
 
-                # Change Y-axis for next drawing. This simulates a moving text upwards
-                rect.move_ip(0, -self.scroll_speed)
-                self.rect_list[i] = rect
+            # Change Y-axis for next drawing. This simulates a moving text upwards
+            self.position -= self.scroll_speed
 
             # Check if last line reached the middle of the screen
-            first_rect = self.rect_list[0]
-            last_rect = self.rect_list[-1]
-            if last_rect.bottom <= (self.max_height // 2) + y:
+            if self.position + self.overall_height <= (self.max_height // 2) + y:
                 self.scroll_speed = self.scroll_speed_base * 8
-            elif first_rect.top <= (self.max_height // 2) + y:
+            elif self.position <= (self.max_height // 2) + y:
                 self.scroll_speed = self.scroll_speed_base
 
-            if last_rect.bottom <= y:
+            if self.position + self.overall_height <= y:
                 self._restart_rect()
 
         else:
             upper_space = (self.max_height - self.overall_height) // 2
-            for i, (image, rect) in enumerate(zip(self.image_list, self.rect_list)):
-                rect.move_ip(x, y + upper_space)
-                surface.blit(image, rect)
+            blit_clipped(surface, self.image, (x, y + upper_space), viewport)
 
     def update_font(self, fontname, size):
         self._fontname = fontname
@@ -728,7 +955,7 @@ class ScrollingTextY(object):
         self.render()
 
 
-class ProgressBarSurface(pygame.Surface):
+class ProgressBarSurface(BaseSurface):
     def __init__(self, size, duration_sec, color_bg=GREY, font=None):
         super(ProgressBarSurface, self).__init__(size)
 
@@ -747,6 +974,7 @@ class ProgressBarSurface(pygame.Surface):
         self._duration_sec = duration_sec
         self.max_value = 100
         self._start_time = 0
+        self._drawn_state = None  # Progress, color and text of the last drawing
 
         self.color_scheme = [(0, 'red'),
                              (90, 'orange'),
@@ -757,6 +985,7 @@ class ProgressBarSurface(pygame.Surface):
                             (100, "Losfahren, auch bei zuwenig Atemschutz-Geräteträger")
                             ]
 
+    @profiled
     def update(self):
         if self._start_time == 0:
             self.start_timer(self._duration_sec)
@@ -777,6 +1006,12 @@ class ProgressBarSurface(pygame.Surface):
             if int(value) >= self.text_scheme[i][0]:
                 index_text = i
 
+        # Only draw again if the bar has grown by a pixel, its color or text has changed or the text is scrolling
+        state = (progress, index_color, index_text)
+        if state == self._drawn_state and self._text_surface.get_rect().width <= self.width:
+            return
+        self._drawn_state = state
+
         # Draw background
         bg_rect = pygame.Rect(0, 0, self.width, self.height)
         pygame.draw.rect(self, self.color_bg, bg_rect)
@@ -796,19 +1031,34 @@ class ProgressBarSurface(pygame.Surface):
         if self.borderwidth:
             pygame.draw.rect(self, BLACK, (0, 0, self.width, self.height), self.borderwidth)
 
+        self.mark_dirty()
+
+    def get_next_frame_delay(self):
+        # A scrolling text and the start of the timer need the next frame immediately
+        if self._drawn_state is None or self._text_surface.get_rect().width > self.width:
+            return 0
+        # A full bar does not change anymore, otherwise it grows by one pixel after the other
+        progress = self._drawn_state[0]
+        if progress >= self.width:
+            return None
+        time_elapsed_sec = (pygame.time.get_ticks() - self._start_time) / 1000
+        return max((progress + 1) * self._duration_sec / self.width - time_elapsed_sec, 0)
+
     def start_timer(self, duration):
         self._duration_sec = duration
         self._start_time = pygame.time.get_ticks()
+        self._drawn_state = None
 
     def stop_timer(self):
         self._start_time = 0
+        self._drawn_state = None
 
     def update_duration(self, duration_sec):
         self.stop_timer()
         self._duration_sec = duration_sec
 
 
-class ResponseOrderSurface(pygame.Surface):
+class ResponseOrderSurface(BaseSurface):
     def __init__(self, size, equipment_list=None, color_bg=GREY, logger=None):
         super(ResponseOrderSurface, self).__init__(size)
         self.logger = logger if logger is not None else Logger(verbose=True, file_path=".\\ResponseOrderSurface.log")
@@ -821,26 +1071,46 @@ class ResponseOrderSurface(pygame.Surface):
         self.borderwidth = 2
         self.color_bg = color_bg
         self._equipment_list = []
-        self._equipment_image_list = []
-        self._equipment_rect_list = []
         self._equipment_images_width = 0
 
-        self.rect = None
+        # All pictures are placed side by side in one surface, which is moved through the bar
+        self._strip = None
+        self._scroll_x = 0  # Left side of the pictures relative to the bar
+        self._redraw = True  # Draw the whole bar with the next update, otherwise only a scrolling strip is drawn
+
         self.scroll_speed_base = 2
         self.scroll_speed = self.scroll_speed_base
 
+        # All vehicle pictures are scaled to the height of the bar in advance, so an alarm does not decode any file
+        self._get_atlas()
+        load_image(DEFAULT_NO_PIC, max_width=self.width, max_height=self.height-10)
+
         if equipment_list is not None:
             self.update_order(equipment_list=equipment_list)
 
+    def _get_atlas(self):
+        # The shared atlas is built again if a vehicle picture has been replaced
+        return get_image_atlas(DEFAULT_PIC_DIR, pattern=EQUIPMENT_PIC_PATTERN, max_width=self.width,
+                               max_height=self.height-10, logger=self.logger)
+
     def update_order(self, equipment_list):
         if self._equipment_list != equipment_list:
-            # Delete old entry, will exchange all
-            self._equipment_list = []
-            self._equipment_image_list = []
-            self._equipment_images_width = 0
+            self.set_strip(equipment_list, self.build_strip(equipment_list))
+
+    def get_equipment_list(self):
+        return self._equipment_list
 
-            for equipment_name in equipment_list:
-                # Load image and scale to available space
+    def build_strip(self, equipment_list):
+        """
+        Draw all pictures of the equipment list side by side into one surface and return it, None if the list is
+        empty. Does not change the shown order, so it can be called from a background thread.
+        """
+        atlas = self._get_atlas()
+        image_list = []
+        for equipment_name in equipment_list:
+            image_obj = atlas.get(equipment_name)
+            if image_obj is None:
+                # Not part of the atlas, load image and scale to available space
                 image_path = os.path.join(DEFAULT_PIC_DIR, equipment_name)
                 self.logger.debug(f"calculate image '{image_path}' for screen")
 
@@ -848,70 +1118,84 @@ class ResponseOrderSurface(pygame.Surface):
                     self.logger.error(f"Could not find picture {image_path}, take 'no_image' instead")
                     image_path = DEFAULT_NO_PIC
 
-                image_obj = pygame.image.load(image_path)
-                image_obj = scale_image(image_obj=image_obj, max_width=self.width, max_height=self.height-10)
-                image_rect = image_obj.get_rect()
-                # image_rect.left = self._equipment_images_width
-                image_rect.topleft = (self._equipment_images_width, (self.height - image_rect.height)//2)
-                self._equipment_images_width += image_obj.get_width()
-
-                self._equipment_list.append(equipment_name)
-                self._equipment_image_list.append(image_obj)
-                self._equipment_rect_list.append(image_rect)
-
-            # If at least one image is in list, take the first as reference for location
-            if self._equipment_image_list:
-                self.rect = self._equipment_image_list[0].get_rect()
+                image_obj = load_image(image_path, max_width=self.width, max_height=self.height-10)
+            image_list.append(image_obj)
+
+        # Draw all pictures once into the strip, vertically centered
+        if not image_list:
+            return None
+        images_width = sum(image_obj.get_width() for image_obj in image_list)
+        strip = convert_for_display(pygame.Surface((images_width, self.height)))
+        strip.fill(self.color_bg)
+        x = 0
+        for image_obj in image_list:
+            strip.blit(image_obj, (x, (self.height - image_obj.get_height()) // 2))
+            x += image_obj.get_width()
+        return strip
+
+    def set_strip(self, equipment_list, strip):
+        """
+        Show the strip created by build_strip for the equipment list, None to show an empty bar
+        """
+        self._equipment_list = list(equipment_list)
+        self._equipment_images_width = strip.get_width() if strip is not None else 0
+        self._strip = strip
+        self._scroll_x = 0
+        self.scroll_speed = self.scroll_speed_base
+        self._redraw = True
 
     def _restart_rect(self):
-        # Re-arrange images to start from the right side
-        x_axis_offset = 0
-        for i, rect in enumerate(self._equipment_rect_list):
-            rect.topleft = (self.width + x_axis_offset, 0)
-            x_axis_offset += rect.width
-            self._equipment_rect_list[i] = rect
+        # Start again from the right side
+        self._scroll_x = self.width
 
+    @profiled
     def update(self):
-        self.fill(self.color_bg)
+        # A strip which fits into the bar does not change, it only has to be drawn once. While the strip scrolls,
+        # only the area within the border changes
+        strip = self._strip
+        scrolling = strip is not None and self._equipment_images_width > self.width
+        if self._redraw:
+            viewport = pygame.Rect(0, 0, self.width, self.height)
+        elif scrolling:
+            viewport = pygame.Rect(0, 0, self.width, self.height).inflate(-2 * self.borderwidth, -2 * self.borderwidth)
+        else:
+            return
+        self.fill(self.color_bg, viewport)
 
         left_padding = self.borderwidth + 1  # Offset of 5 pixels as the boarder already takes 4 pixel
 
         # Only update if equipment is listed
-        if self._equipment_image_list:
+        if strip is not None:
+            blit_clipped(self, strip, (self._scroll_x + left_padding, 0), viewport)
+
             # Only scroll if all images are wither than space available
             if self._equipment_images_width > self.width:
-                for i, (image, rect) in enumerate(zip(self._equipment_image_list, self._equipment_rect_list)):
-                    current_rect = rect.move(left_padding, 0)
-                    self.blit(image, current_rect)
-
-                    # Change x-axis for next drawing. This simulates a moving text upwards
-                    rect.move_ip(-self.scroll_speed, 0)
-                    self._equipment_rect_list[i] = rect
+                # Change x-axis for next drawing. This simulates a moving text upwards
+                self._scroll_x -= self.scroll_speed
 
                 # Check if last image reached the middle of the screen
-                first_rect = self._equipment_rect_list[0]
-                last_rect = self._equipment_rect_list[-1]
-                if last_rect.right <= (self.width // 2) + left_padding:
+                if self._scroll_x + self._equipment_images_width <= (self.width // 2) + left_padding:
                     self.scroll_speed = self.scroll_speed_base * 8
-                elif first_rect.left <= (self.width // 2) + left_padding:
+                elif self._scroll_x <= (self.width // 2) + left_padding:
                     self.scroll_speed = self.scroll_speed_base
 
-                if last_rect.right <= left_padding:
+                if self._scroll_x + self._equipment_images_width <= left_padding:
                     self._restart_rect()
 
-            else:
-                next_image_left = self.rect.left + left_padding
-                for image_obj in self._equipment_image_list:
-                    rect = image_obj.get_rect()
-                    rect.move_ip(next_image_left, 0)
-                    next_image_left += rect.width
-                    self.blit(image_obj, rect)
-
-        if self.borderwidth:
+        if self._redraw and self.borderwidth:
             pygame.draw.rect(self, BLACK, (0, 0, self.width, self.height), self.borderwidth)
 
+        self.mark_dirty(viewport)
+        self._redraw = False
+
+    def get_next_frame_delay(self):
+        # Only a strip which is wider than the bar moves
+        if self._redraw or (self._strip is not None and self._equipment_images_width > self.width):
+            return 0
+        return None
 
-class MessageSurface(pygame.Surface):
+
+class MessageSurface(BaseSurface):
     def __init__(self, size, message="", logger=None):
         super(MessageSurface, self).__init__(size)
         self.logger = logger if logger is not None else Logger(verbose=True, file_path=".\\MessageSurface.log")
@@ -930,44 +1214,72 @@ class MessageSurface(pygame.Surface):
         self.space_height = self.get_height() * 0.05
         self.message_height = self.get_height() * 0.4  # This should show 2 lines and scroll if more
 
+        # Load the fonts now, otherwise they are loaded when the first alarm is shown
+        font_registry.preload(DEFAULT_FONT_BOLD, [self.case_height, self.address_height, self.details_height,
+                                                  self.message_height])
+
+        # Create the backgrounds of all cases now, so an alarm does not have to wait for its background
+        gradient_cache.preload(WHITE, list(CASE_COLOR_DICT.values()) + [pygame.Color('grey'), pygame.Color('gold')],
+                               self.get_size())
+
         self.background_surface = None
+        self._redraw = True  # Draw the whole bar with the next update, otherwise only the scrolling texts are drawn
         self.render_background(WHITE, RED)
         self.update_text(message)
 
-    def update(self):
-        self.fill((0, 0, 0))
-        self.blit(self.background_surface, (0, 0))
+    def _get_texts(self):
+        """
+        Return the shown texts together with their position
+        """
         if self.case_text:
-            self.case_text.draw(self,    10, self.space_height)
-            self.address_text.draw(self,  0, self.space_height * 2 + self.case_height)
-            self.details_text.draw(self,  0, self.space_height * 3 + self.case_height + self.address_height)
+            return [(self.case_text,    10, self.space_height),
+                    (self.address_text,  0, self.space_height * 2 + self.case_height),
+                    (self.details_text,  0, self.space_height * 3 + self.case_height + self.address_height)]
+        return [(self.message_text, 0, 0)]
+
+    @profiled
+    def update(self):
+        # A text which fits into the bar does not change, it only has to be drawn once after the message or the
+        # background has been set. Afterwards only the area of the scrolling texts is drawn again
+        texts = self._get_texts()
+        if self._redraw:
+            areas = [self.get_rect()]
+            self._redraw = False
         else:
-            self.message_text.draw(self, 0, 0)
+            # Overlapping areas of scrolling texts are joined, so every text is drawn (and scrolled) only once
+            areas = []
+            for text, x, y in texts:
+                if text.is_scrolling(self):
+                    area = text.get_viewport(self, x, y)
+                    index = area.collidelist(areas)
+                    while index != -1:
+                        area.union_ip(areas.pop(index))
+                        index = area.collidelist(areas)
+                    areas.append(area)
+
+        # The texts may overlap the area of their neighbours, draw all texts within the area but clipped to it
+        for area in areas:
+            self.set_clip(area)
+            self.blit(self.background_surface, area, area)
+            for text, x, y in texts:
+                if area.colliderect(text.get_viewport(self, x, y)):
+                    text.draw(self, x, y)
+            self.mark_dirty(area)
+        self.set_clip(None)
+
+    def get_next_frame_delay(self):
+        if self._redraw or any(text.is_scrolling(self) for text, _, _ in self._get_texts()):
+            return 0
+        return None
 
     def render_background(self, top_color_bg, bottom_color_bg):
-        self.background_surface = pygame.Surface(self.get_size())
-        self.background_surface.fill(pygame.Color(top_color_bg))
-
-        width = self.get_width()
-        height = int(self.get_height())
-        top_color = pygame.Color(top_color_bg)
-        bottom_color = pygame.Color(bottom_color_bg)
-
-        # Calculate color for each vertical pixel and draw it to the background
-        for y in range(height):
-
-            # Calculate the color for this row
-            t = y / (height - 1)
-            row_color = top_color.lerp(bottom_color, t)
-
-            # Fill the row with the color
-            rect = pygame.Rect(0, y, width, 1)
-            # rect = pygame.Rect(0, y + height, width, 1)
-            pygame.draw.rect(self.background_surface, row_color, rect)
+        self.background_surface = get_gradient(top_color_bg, bottom_color_bg, self.get_size())
+        self._redraw = True
 
     def update_text(self, message):
 
         self.event_obj = EventInfo(event_msg=message)
+        self._redraw = True
 
         if self.event_obj.parsed:
             case_str = CASE_LEVEL_DICT.get(self.event_obj.case_and_level, f"Gruppe: {self.event_obj.case_and_level}")
@@ -1000,7 +1312,7 @@ class MessageSurface(pygame.Surface):
 
 
 # ---- SCREENS ----------------------------
-class BaseScreen(pygame.Surface):
+class BaseScreen(BaseSurface):
     def __init__(self, size):
         super(BaseScreen, self).__init__(size)
         self.size = size
@@ -1011,6 +1323,19 @@ class BaseScreen(pygame.Surface):
     def update(self):
         raise NotImplementedError("'update' method not implemented for this screen class")
 
+    def activate(self):
+        """
+        Called by the GuiThread every time before the screen is shown and configured. The screen instances are
+        reused, so reset everything here which must not survive from the last time the screen was shown.
+        """
+        self.mark_dirty()
+
+    def deactivate(self):
+        """
+        Called by the GuiThread as soon as another screen is shown. Stop everything which runs in the background.
+        """
+        pass
+
 
 class SplashScreen(BaseScreen):
     def __init__(self, size, company_path_logo="", color_bg=BLACK, color_fg=WHITE, logger=None):
@@ -1031,6 +1356,7 @@ class SplashScreen(BaseScreen):
                                                  show_date   = True,
                                                  show_weekday= True)
         self._main_surface = pygame.Surface((self.get_width(), self.get_height()-self.header_height))
+        self._redraw_main = True
         self._set_logo()
 
     def _set_logo(self):
@@ -1042,9 +1368,7 @@ class SplashScreen(BaseScreen):
         self._main_surface.fill(self.color_bg)
 
         if os.path.isfile(self.company_path_logo):
-            # Load image
-            image = pygame.image.load(self.company_path_logo)
-            image = scale_image(image_obj=image, max_width=max_image_width, max_height=max_image_height)
+            image = load_image(self.company_path_logo, max_width=max_image_width, max_height=max_image_height)
 
             # Center image in the middle of the surface
             x = (surface_width - image.get_width()) // 2
@@ -1054,12 +1378,28 @@ class SplashScreen(BaseScreen):
             pygame.draw.line(self._main_surface, RED, (0, 0), (surface_width, surface_height), 5)
             pygame.draw.line(self._main_surface, RED, (surface_width, 0), (0, surface_height), 5)
 
+        self._redraw_main = True
+
+    @profiled
     def update(self):
-        self.fill(self.color_bg)
+        # The logo does not change between two frames, only redraw it after a (re-)configuration
+        if self._redraw_main:
+            self.fill(self.color_bg)
+            self.blit(self._main_surface, (0, self.header_height + 1))
+            self.mark_dirty()
+            self._header_surface_obj.mark_dirty()
+            self._redraw_main = False
 
         self._header_surface_obj.update()
-        self.blit(self._header_surface_obj, (0, 0))
-        self.blit(self._main_surface, (0, self.header_height + 1))
+        self.blit_dirty(self._header_surface_obj, (0, 0))
+
+    def get_next_frame_delay(self):
+        # Only the clock in the header changes
+        return self._header_surface_obj.get_next_frame_delay()
+
+    def activate(self):
+        super(SplashScreen, self).activate()
+        self._redraw_main = True
 
     def configure(self, **kw):
         update_image = False
@@ -1145,13 +1485,22 @@ class EventScreen(BaseScreen):
                                                        equipment_list=equipment_list,
                                                        logger=self.logger)
 
+        # The images and the response order of an alarm are loaded in parallel. The pending loads are
+        # stored by their name together with the function to take over their result and their start time
+        self._loader = concurrent.futures.ThreadPoolExecutor(max_workers=ASSET_LOADER_WORKERS,
+                                                             thread_name_prefix="EventAssetLoader")
+        self._tasks = dict()
+
         # Configure images
         self.image_path_left = image_path_left
         self.image_obj_left = None
         self.image_rect_left = None
+        self.image_box_left = None
         self.image_path_right = image_path_right
         self.image_obj_right = None
         self.image_rect_right = None
+        self.image_box_right = None
+        self._redraw_images = True
         self.update_images()
 
         # Sound
@@ -1162,14 +1511,41 @@ class EventScreen(BaseScreen):
         self.sound_obj = AlarmSound(path=path_sound_folder, logger=self.logger)
 
     def __del__(self):
+        # The object may only be partly built if the constructor has failed
+        sound_obj = getattr(self, "sound_obj", None)
+        if sound_obj is not None:
+            sound_obj.stop()
+        loader = getattr(self, "_loader", None)
+        if loader is not None:
+            loader.shutdown(wait=False)
+
+    def activate(self):
+        super(EventScreen, self).activate()
+        self._redraw_images = True
+
+        # The sound file and repetition are given with every event, do not play the sound from the last event
+        self.sound_file = ""
+        self.sound_repeat = 1
+
+        # Restart the progress bar with the next update
+        self.progress_bar_obj.stop_timer()
+
+    def deactivate(self):
         self.sound_obj.stop()
 
+        # Drop the assets which are still loading, they belong to an event which is no longer shown
+        for future, _, _ in self._tasks.values():
+            future.cancel()
+        self._tasks = dict()
+
     def configure(self, **kw):
         update_image = False
         update_sound = False
+        alarm_message = None
+        equipment_list = None
         for key, value in list(kw.items()):
             if key == 'alarm_message':
-                self.message_obj.update_text(value)
+                alarm_message = value
             elif key == 'image_left':
                 update_image = True
                 self.image_path_left = value
@@ -1177,7 +1553,7 @@ class EventScreen(BaseScreen):
                 update_image = True
                 self.image_path_right = value
             elif key == 'equipment_list':
-                self.response_order_obj.update_order(equipment_list=value)
+                equipment_list = value
             elif key == 'progress_bar_duration':
                 self.progress_bar_obj.update_duration(duration_sec=value)
             elif key == 'show_alarm_message':
@@ -1211,12 +1587,76 @@ class EventScreen(BaseScreen):
             else:
                 self.logger.error(f"Unknown configuration set: '{key}': '{value}'")
 
-        if update_image:
-            self.update_images()
+        # Loading and starting the sound is cheap, start it here so it is bound to the lifetime of this screen
         if update_sound:
             self.update_sound()
 
+        # The images and the response order do not depend on each other, load them all at once. The alarm message is
+        # rendered meanwhile and shown with the next frame, the other assets follow as soon as they are ready
+        if update_image:
+            self._submit_images()
+        if equipment_list is not None and equipment_list != self.response_order_obj.get_equipment_list():
+            # Do not show the vehicles of the last alarm while the new ones are prepared
+            self.response_order_obj.set_strip([], None)
+            self._submit_task("equipment", self.response_order_obj.build_strip, equipment_list,
+                              apply=lambda strip: self.response_order_obj.set_strip(equipment_list, strip))
+        if alarm_message is not None:
+            self.message_obj.update_text(alarm_message)
+
+        # Assets which are ready within a fraction of a frame (e.g. from the image cache) are shown with the first
+        # frame, all others are filled in by update() as soon as they are ready
+        self._poll_tasks(wait=ASSET_FIRST_FRAME_WAIT)
+
+    def _submit_task(self, name, function, *args, apply=None):
+        """
+        Start the function in the loader. As soon as it is done, apply is called with its result in the GUI thread.
+        A pending task with the same name is replaced, its result is dropped.
+        """
+        self._tasks[name] = (self._loader.submit(function, *args), apply, time.time())
+
+    def _poll_tasks(self, wait=0):
+        """
+        Take over the results of all finished tasks. Tasks which take longer than ASSET_LOAD_TIMEOUT are logged once,
+        their result is still shown as soon as it is ready.
+
+        :param wait: Time in seconds to wait for the pending tasks
+        """
+        if not self._tasks:
+            return
+        if wait:
+            concurrent.futures.wait([future for future, _, _ in self._tasks.values()], timeout=wait)
+
+        now = time.time()
+        for name, (future, apply, started) in list(self._tasks.items()):
+            if not future.done():
+                if started is not None and now - started > ASSET_LOAD_TIMEOUT:
+                    self.logger.warning(f"{name} not loaded within {ASSET_LOAD_TIMEOUT} seconds, show it as soon as "
+                                        f"it is ready")
+                    self._tasks[name] = (future, apply, None)
+                continue
+            del self._tasks[name]
+            try:
+                result = future.result()
+            except Exception as e:
+                self.logger.error(f"Could not load {name} for event screen", exception=e.args)
+                continue
+            if apply is not None:
+                apply(result)
+
+    def _load_image(self, image_path, max_width, max_height):
+        if not os.path.isfile(image_path):
+            self.logger.error(f"Could not find picture {image_path}, take 'no_image' instead")
+            image_path = DEFAULT_NO_PIC
+        return load_image(image_path, max_width=max_width, max_height=max_height)
+
     def update_images(self):
+        self._submit_images()
+        self._poll_tasks(wait=ASSET_LOAD_TIMEOUT)
+
+    def _submit_images(self):
+        """
+        Calculate the place of the images and start to load them. Until they are loaded, a placeholder is shown
+        """
         # Calculate size of Images
         progress_height = int(self.show_progress_bar)   * self.progress_bar_height
         response_height = int(self.show_response_order) * self.response_order_height
@@ -1230,35 +1670,46 @@ class EventScreen(BaseScreen):
         if not self.image_path_right:
             # Only single picture available, delete second if it was defined prior
             self.image_obj_right = None
+            self._tasks.pop("image_right", None)
         else:
             # Two picture shall be shown --> divide available space for each image
             images_width = images_width // 2
 
-        if self.image_path_left:
-            image_path = self.image_path_left
-            if not os.path.isfile(image_path):
-                self.logger.error(f"Could not find picture {image_path}, take 'no_image' instead")
-                image_path = DEFAULT_NO_PIC
+        self.image_box_left = pygame.Rect(0, message_height, images_width, self.images_height)
+        self.image_box_right = pygame.Rect(images_width, message_height, images_width, self.images_height)
 
-            image_obj = pygame.image.load(image_path)
-            image_obj = scale_image(image_obj=image_obj, max_width=images_width, max_height=self.images_height)
+        def set_left_image(image_obj):
             image_rect = image_obj.get_rect()
-            image_rect.center = (images_width // 2, message_height + self.images_height // 2)
+            image_rect.center = self.image_box_left.center
             self.image_obj_left = image_obj
             self.image_rect_left = image_rect
+            self._redraw_images = True
 
-        if self.image_path_right:
-            image_path = self.image_path_right
-            if not os.path.isfile(image_path):
-                self.logger.error(f"Could not find picture {image_path}, take 'no_image' instead")
-                image_path = DEFAULT_NO_PIC
-
-            image_obj = pygame.image.load(image_path)
-            image_obj = scale_image(image_obj=image_obj, max_width=images_width, max_height=self.images_height)
+        def set_right_image(image_obj):
             image_rect = image_obj.get_rect()
-            image_rect.center = (images_width + images_width // 2, message_height + self.images_height // 2)
+            image_rect.center = self.image_box_right.center
             self.image_obj_right = image_obj
             self.image_rect_right = image_rect
+            self._redraw_images = True
+
+        if self.image_path_left:
+            self.image_obj_left = None
+            self._submit_task("image_left", self._load_image, self.image_path_left, images_width, self.images_height,
+                              apply=set_left_image)
+        if self.image_path_right:
+            self.image_obj_right = None
+            self._submit_task("image_right", self._load_image, self.image_path_right, images_width,
+                              self.images_height, apply=set_right_image)
+
+        self._redraw_images = True
+
+    def _draw_placeholder(self, box):
+        """
+        Show that the image of this box is still loading
+        """
+        pygame.draw.rect(self, GREY, box.inflate(-20, -20), 2)
+        text = render_text("Bild wird geladen ...", DEFAULT_FONT, 40, GREY)
+        self.blit(text, text.get_rect(center=box.center))
 
     def update_sound(self):
         if self.sound_file and self.sound_obj.is_file(self.sound_file):
@@ -1272,26 +1723,44 @@ class EventScreen(BaseScreen):
         else:
             self.logger.warning("Could not start sound, no file defined")
 
+    @profiled
     def update(self):
-        self.fill(BLACK)
+        # Take over the assets which have been loaded since the last frame
+        self._poll_tasks()
+
+        # The images are static, only redraw them (and the background) if they have been changed
+        if self._redraw_images:
+            self.fill(BLACK)
+            if self.image_obj_left:
+                self.blit(self.image_obj_left, self.image_rect_left)
+            elif "image_left" in self._tasks:
+                self._draw_placeholder(self.image_box_left)
+            if self.image_obj_right:
+                self.blit(self.image_obj_right, self.image_rect_right)
+            elif "image_right" in self._tasks:
+                self._draw_placeholder(self.image_box_right)
+            self.mark_dirty()
+            # The message bar, the progress bar and the response order are only drawn if they change, copy them again
+            # to the cleared screen
+            if self.show_message_bar:
+                self.message_obj.mark_dirty()
+            if self.show_progress_bar:
+                self.progress_bar_obj.mark_dirty()
+            if self.show_response_order:
+                self.response_order_obj.mark_dirty()
+            self._redraw_images = False
 
         # Update and blit the message bar if available
         if self.show_message_bar:
             self.message_obj.update()
-            self.blit(self.message_obj, (0, 0))
-
-        # blit images if available
-        if self.image_obj_left:
-            self.blit(self.image_obj_left, self.image_rect_left)
-        if self.image_obj_right:
-            self.blit(self.image_obj_right, self.image_rect_right)
+            self.blit_dirty(self.message_obj, (0, 0))
 
         # Update and blit progress bar if available
         if self.show_progress_bar:
             progress_offset = self.images_height
             progress_offset += int(self.show_message_bar) * int(self.message_bar_height)
             self.progress_bar_obj.update()
-            self.blit(self.progress_bar_obj, (0, progress_offset))
+            self.blit_dirty(self.progress_bar_obj, (0, progress_offset))
 
         # Update and blit response order bar if available
         if self.show_response_order:
@@ -1299,7 +1768,19 @@ class EventScreen(BaseScreen):
             response_offset += int(self.show_message_bar) * int(self.message_bar_height)
             response_offset += int(self.show_progress_bar) * int(self.progress_bar_height)
             self.response_order_obj.update()
-            self.blit(self.response_order_obj, (0, response_offset))
+            self.blit_dirty(self.response_order_obj, (0, response_offset))
+
+    def get_next_frame_delay(self):
+        # The assets which are still loading are taken over by the next frame
+        if self._tasks or self._redraw_images:
+            return 0
+
+        # Only the scrolling texts, the growing progress bar and a scrolling response order change
+        children = [(self.show_message_bar, self.message_obj),
+                    (self.show_progress_bar, self.progress_bar_obj),
+                    (self.show_response_order, self.response_order_obj)]
+        delays = [d for d in (surface.get_next_frame_delay() for shown, surface in children if shown) if d is not None]
+        return min(delays) if delays else None
 
 
 class ClockScreen(BaseScreen):
@@ -1333,6 +1814,8 @@ class ClockScreen(BaseScreen):
         self.color_bg = BLACK
         self.color_fg = WHITE
 
+        self.fill(self.color_bg)
+
         self._analog_clk = AnalogClockSurface(size             = (self.size[0], self.size[1]*0.8),
                                               color_bg         = self.color_bg,
                                               show_second_hand = True,
@@ -1347,12 +1830,18 @@ class ClockScreen(BaseScreen):
                                                 show_date = True,
                                                 logger    = self.logger)
 
+    @profiled
     def update(self):
-        self.fill(self.color_bg)
         self._analog_clk.update()
-        self.blit(self._analog_clk, (0, 0))
+        self.blit_dirty(self._analog_clk, (0, 0))
         self._digital_clk.update()
-        self.blit(self._digital_clk, (0, self._analog_clk.get_height()))
+        self.blit_dirty(self._digital_clk, (0, self._analog_clk.get_height()))
+
+    def get_next_frame_delay(self):
+        # The hands and the digital clock change at most once per second
+        delays = [d for d in (self._analog_clk.get_next_frame_delay(), self._digital_clk.get_next_frame_delay())
+                  if d is not None]
+        return min(delays) if delays else None
 
     def configure(self, **kw):
         for key, value in list(kw.items()):
@@ -1383,14 +1872,24 @@ class SlideshowScreen(BaseScreen):
         self.display_duration    = kwargs.get("seconds_between_images", 4)
 
         self.last_image_time     = None
-        self.image_list          = []
+        self.last_refresh_time   = 0
         self.new_image           = None
         self.current_image       = None
-        self.current_image_index = 0
         self.fade_alpha          = 0  # can be -1 ... 1 where -1 is the old image and 1 the new
+        self._fade_start_alpha   = 0
+        self._fade_start_time    = 0
+        self._fade_rect          = None
+        self._fade_frame         = None  # Buffer of the new image, reused for every fade
+        self._redraw_image       = True
         self.fade_over_bg        = kwargs.get("fade_over_background", False)
-        if self.slideshow_path:
-            self.load_images()
+
+        # The content of the slideshow folder is kept in an index which is only updated with the changed files
+        self._index = SlideshowIndex(sort_alphabetically=self.sort_alphabetically, logger=self.logger)
+
+        # The images are stored scaled to the display size on the disk, so every photo is decoded only once. The
+        # next images are loaded in the background, so the fade does not stall while loading
+        self._disk_cache = DiskImageCache(cache_dir=kwargs.get("cache_path") or DISK_CACHE_DIR, logger=self.logger)
+        self._prefetcher = ImagePrefetcher(disk_cache=self._disk_cache, logger=self.logger, name="SlideshowPrefetcher")
 
         # Store settings for header-bar
         self.show_header_bar   = kwargs.get("show_header", True)
@@ -1404,13 +1903,19 @@ class SlideshowScreen(BaseScreen):
                                                  company_path_logo = self.company_path_logo,
                                                  company_name      = self.company_name)
 
-        self._font = get_font_obj(font_name=DEFAULT_FONT_BOLD, font_size=50)
+        self._font_size = 50
 
         self.bg_color = BLACK
         self.fg_color = RED
 
+        if self.slideshow_path:
+            self.load_images()
+
     def load_images(self):
-        images = []
+        """
+        Update the index of the slideshow folder. Only added, removed or modified images are processed, the position
+        in the slideshow is kept
+        """
         successful = True
 
         # Check if path to images is defined
@@ -1419,128 +1924,199 @@ class SlideshowScreen(BaseScreen):
             successful = False
 
         # check if slideshow folder already exists and create it if necessary
-        if os.path.exists(self.slideshow_path):
-            for filename in os.listdir(self.slideshow_path):
-                if filename.lower().endswith(('.jpg', '.jpeg', '.bmp', '.png', '.gif', '.eps', '.tif', '.tiff')):
-                    images.append(filename)
-        else:
+        if not os.path.exists(self.slideshow_path):
             try:
                 os.makedirs(self.slideshow_path)
             except FileNotFoundError as e:
                 self.logger.critical(f"Could not create temporary folder, probably root drive "
                                      f"in path '{self.slideshow_path}' is not existing", exception=e.args)
 
-        self.current_image_index = 0
-        self.image_list = images
-        self.sort_images()
+        self.last_refresh_time = time.time()
+        if self._index.set_path(self.slideshow_path):
+            self._restart_prefetch()
         return successful
 
     def sort_images(self):
-        if self.sort_alphabetically:
-            self.image_list = sorted(self.image_list)
-        else:
-            self.image_list = random.sample(self.image_list, len(self.image_list))
-
-    def get_next_image_obj(self):
-        if self.image_list:
-
-            if self.current_image_index >= len(self.image_list):
-                self.current_image_index = 0
+        if self._index.set_sort_alphabetically(self.sort_alphabetically):
+            self._restart_prefetch()
 
-            max_height = self.size[1]
-            if self.show_header_bar:
-                max_height -= self.header_height
+    def _restart_prefetch(self):
+        """
+        Prefetch the images starting with the next one to show. Must be called whenever the image list or the size
+        of the images changes
+        """
+        max_height = self.size[1]
+        if self.show_header_bar:
+            max_height -= self.header_height
 
-            path = os.path.join(self.slideshow_path, self.image_list[self.current_image_index])
-            image = pygame.image.load(path)
-            image = scale_image(image_obj  = image,
-                                max_height = max_height,
-                                max_width  = self.size[0])
+        # The prefetcher also removes cached images of deleted or modified files in its thread
+        self._prefetcher.set_sequence(paths       = self._index.get_paths(),
+                                      start_index = self._index.position,
+                                      max_width   = self.size[0],
+                                      max_height  = max_height)
 
-            self.current_image_index += 1
+    @profiled
+    def get_next_image_obj(self):
+        """
+        Return the next image or None if the prefetcher has not finished it yet
+        """
+        if len(self._index):
+            item = self._prefetcher.get()
+            if item is None:
+                return None
+            index, path, image = item
+            self._index.position = index + 1
+            if image is None:
+                # Could not be loaded, the prefetcher already reported it. Try it with the next image
+                return None
         else:
-            image = self._font.render("Keine Bilder zum Anzeigen :(", True, self.fg_color, self.bg_color)
+            image = render_text("Keine Bilder zum Anzeigen :(", DEFAULT_FONT_BOLD, self._font_size, self.fg_color,
+                                self.bg_color)
 
         return image
 
-    def update(self):
+    def get_next_frame_delay(self):
+        # Fading (or waiting for the first image) is animated
+        if self.current_image is None or self.last_image_time is None:
+            return 0
 
-        self.fill(self.bg_color)
+        delay = max(self.display_duration - (time.time() - self.last_image_time), 0)
+        if self.show_header_bar:
+            header_delay = self._header_surface_obj.get_next_frame_delay()
+            if header_delay is not None:
+                delay = min(delay, header_delay)
+        return delay
 
-        # If this is the first call, the current image is empty
-        if self.current_image is None:
-            self.current_image = self.get_next_image_obj()
+    def activate(self):
+        super(SlideshowScreen, self).activate()
+        self._redraw_image = True
+
+        # Show the current image for the full display duration before fading to the next one
+        if self.last_image_time is not None:
             self.last_image_time = time.time()
-            self.fade_alpha = 1  # Completely faded
 
-        # Check if picture shall be updated
-        if self.fade_alpha >= 1 and time.time() - self.last_image_time >= self.display_duration:
-            self.new_image = self.get_next_image_obj()
-            self.fade_alpha = -1 if self.fade_over_bg else 0
-            self.last_image_time = None
+        # Continue to prepare the next images, the ones prepared before are still ready
+        self._prefetcher.start()
+
+    def deactivate(self):
+        # Do not decode images in the background while another screen is shown
+        self._prefetcher.stop()
 
-        # If fading is in progress, the alpha channel is less than 1
-        if self.fade_alpha < 1:
-            header_height = self.header_height if self.show_header_bar else 0
-            fade_surface = pygame.Surface((self.size[0], self.size[1]-header_height))
-            fade_surface.fill(BLACK)
+    def _get_image_area(self):
+        """
+        Return the area below the header bar in which the images are shown
+        """
+        header_height = self.header_height if self.show_header_bar else 0
+        return pygame.Rect(0, header_height, self.size[0], self.size[1] - header_height)
 
-            # The fade range is -1 ... 1 where -1 is the complete old image while 1 is the complete new image
+    def _get_image_rect(self, image):
+        """
+        Return the position of the image centered in the image area
+        """
+        image_rect = image.get_rect()
+        image_rect.center = self._get_image_area().center
+        return image_rect
+
+    def _start_fade(self):
+        """
+        Prepare the fade from the current to the new image. Only the area covered by one of both images changes
+        """
+        image_area = self._get_image_area()
+        old_rect = self._get_image_rect(self.current_image)
+        new_rect = self._get_image_rect(self.new_image)
+        self._fade_rect = old_rect.union(new_rect)
+
+        # The frame buffer is reused for all fades and only replaced if the size of the image area changes
+        if self._fade_frame is None or self._fade_frame.get_size() != image_area.size:
+            self._fade_frame = pygame.Surface(image_area.size)
+            if pygame.display.get_surface() is not None:
+                self._fade_frame = self._fade_frame.convert()
+
+        # Prepare the new image with the surrounding background, so it also fades in over the old image's area. If
+        # faded over the background, the buffer only holds the background which covers the images
+        self._fade_frame.set_alpha(None)
+        self._fade_frame.fill(self.bg_color, self._fade_rect.move(0, -image_area.top))
+        if not self.fade_over_bg:
+            self._fade_frame.blit(self.new_image, new_rect.move(0, -image_area.top))
+
+        self.fade_alpha = -1 if self.fade_over_bg else 0
+        self._fade_start_alpha = self.fade_alpha
+        self._fade_start_time = time.time()
+
+    @profiled
+    def _draw_fade(self):
+        image_area = self._get_image_area()
+        self.fill(self.bg_color, self._fade_rect)
+        self.mark_dirty(self._fade_rect)
+
+        # The fade range is -1 ... 1 where -1 is the complete old image while 1 is the complete new image
+        if self.fade_over_bg:
+            # Fade out old picture to the background, then fade in the new picture
             if self.fade_alpha < 0:
-                # Fade out old picture
-                fade_surface.set_alpha(255 - int(abs(self.fade_alpha) * 255))
-                x = (self.size[0] - self.current_image.get_width()) // 2
-                y = (self.size[1] - self.current_image.get_height()) // 2
-                if self.show_header_bar:
-                    y += self.header_height
-                self.blit(self.current_image, (x, y))
-                self.blit(fade_surface, (x, y))
+                image = self.current_image
+            else:
+                image = self.new_image
+            image_rect = self._get_image_rect(image)
+            self.blit(image, image_rect)
+            self._fade_frame.set_alpha(255 - int(abs(self.fade_alpha) * 255))
+            self.blit(self._fade_frame, image_rect, image_rect.move(0, -image_area.top))
+        else:
+            # Do not fade over background color, so directly fade out old picture and fade in new
+            self.blit(self.current_image, self._get_image_rect(self.current_image))
+            self._fade_frame.set_alpha(int(self.fade_alpha * 255))
+            self.blit(self._fade_frame, self._fade_rect, self._fade_rect.move(0, -image_area.top))
+
+    @profiled
+    def update(self):
+
+        # If this is the first call, the current image is empty. Wait until the prefetcher has it ready
+        if self.current_image is None:
+            self.current_image = self.get_next_image_obj()
+            if self.current_image is not None:
+                self.last_image_time = time.time()
+                self.fade_alpha = 1  # Completely faded
+                self._redraw_image = True
+
+        # Check if picture shall be updated. If the next image is not ready yet, keep the current one a little longer
+        if self.current_image is not None and self.new_image is None and \
+                time.time() - self.last_image_time >= self.display_duration:
+            self.new_image = self.get_next_image_obj()
+            if self.new_image is not None:
+                self._start_fade()
+                self.last_image_time = None
+
+        # If fading is in progress, the alpha channel is less than 1. The progress depends on the time, so a slow
+        # frame does not slow down the fade
+        if self.new_image is not None:
+            self.fade_alpha = min(self._fade_start_alpha + (time.time() - self._fade_start_time) / FADE_DURATION, 1)
+            if self.fade_alpha < 1:
+                self._draw_fade()
             else:
-                if self.fade_over_bg:
-                    # Fade in new picture
-                    fade_surface.set_alpha(255 - int(self.fade_alpha * 255))
-                    x = (self.size[0] - self.new_image.get_width()) // 2
-                    y = (self.size[1] - self.new_image.get_height()) // 2
-                    if self.show_header_bar:
-                        y += self.header_height
-                    self.blit(self.new_image, (x, y))
-                    self.blit(fade_surface, (x, y))
-                else:
-                    # Do not fade over background color, so directly fade out old picture and fade in new
-                    self.current_image.set_alpha(255 - int(self.fade_alpha * 255))
-                    self.new_image.set_alpha(int(self.fade_alpha * 255))
-
-                    x_old = (self.size[0] - self.current_image.get_width()) // 2
-                    y_old = (self.size[1] - self.current_image.get_height()) // 2
-                    x_new = (self.size[0] - self.new_image.get_width()) // 2
-                    y_new = (self.size[1] - self.new_image.get_height()) // 2
-                    if self.show_header_bar:
-                        y_old += self.header_height
-                        y_new += self.header_height
-                    self.blit(self.current_image, (x_old, y_old))
-                    self.blit(self.new_image, (x_new, y_new))
-
-            # Increment fade step and check if fading is finished
-            self.fade_alpha += 1/FPS
-            if self.fade_alpha >= 1:
                 self.last_image_time = time.time()
                 self.current_image = self.new_image
                 self.new_image = None
-        else:
-            # No fade, just show picture
-            x = (self.size[0] - self.current_image.get_width()) // 2
-            y = (self.size[1] - self.current_image.get_height()) // 2
-            if self.show_header_bar:
-                y += self.header_height
-            self.blit(self.current_image, (x, y))
+                self._redraw_image = True
+
+                # Look for new or removed images while the next image has the whole display duration to be prefetched
+                if self.last_image_time - self.last_refresh_time >= SLIDESHOW_REFRESH_INTERVAL:
+                    self.load_images()
+
+        if self._redraw_image and self.current_image is not None:
+            # No fade, just show picture. As long as the picture does not change, it has to be drawn only once
+            image_area = self._get_image_area()
+            self.fill(self.bg_color, image_area)
+            self.blit(self.current_image, self._get_image_rect(self.current_image))
+            self.mark_dirty(image_area)
+            self._redraw_image = False
 
         # Update header
         if self.show_header_bar:
             self._header_surface_obj.update()
-            self.blit(self._header_surface_obj, (0, 0))
+            self.blit_dirty(self._header_surface_obj, (0, 0))
 
     def configure(self, **kw):
-        for key, value in list(kw.items()):
+        # Set the cache folder first, the images of a new slideshow path must not be prepared in the former folder
+        for key, value in sorted(kw.items(), key=lambda item: item[0] != 'cache_path'):
             if key == 'seconds_between_images':
                 self.display_duration = int(value)
                 self.logger.info("Set 'seconds_between_images' to {}".format(value))
@@ -1552,20 +2128,32 @@ class SlideshowScreen(BaseScreen):
                 self.logger.info("Set 'sort_alphabetically' to {}".format(value))
                 self.sort_images()
             elif key == 'slideshow_path':
-                self.slideshow_path = value
-                self.logger.info("Set 'slideshow_path' to {}".format(value))
-                self.load_images()
+                # The path is sent with every switch to the slideshow. New images of the same path are found by
+                # the regular refresh, the prepared images are kept
+                if value != self.slideshow_path or not len(self._index):
+                    self.slideshow_path = value
+                    self.logger.info("Set 'slideshow_path' to {}".format(value))
+                    self.load_images()
             elif key == 'company_path_logo':
                 self.company_path_logo = value
                 self.logger.info("Set 'company_path_logo' to {}".format(value))
                 self._header_surface_obj.configure(company_path_logo=self.company_path_logo)
-                self.load_images()
+            elif key == 'cache_path':
+                if (value or DISK_CACHE_DIR) != self._disk_cache.cache_dir:
+                    self._disk_cache.cache_dir = value or DISK_CACHE_DIR
+                    self.logger.info("Set 'cache_path' to {}".format(self._disk_cache.cache_dir))
+                    self._restart_prefetch()
             elif key == 'company_name':
                 self.company_name = value
                 self._header_surface_obj.configure(company_name=self.company_name)
             elif key == 'show_header_bar':
-                self.show_header_bar = value
-                self.logger.info("Set 'show_header_bar' to {}".format(value))
+                # The size of the images depends on the header bar, only prepare them again if it changes
+                if value != self.show_header_bar:
+                    self.show_header_bar = value
+                    self.logger.info("Set 'show_header_bar' to {}".format(value))
+                    self._header_surface_obj.mark_dirty()
+                    self._redraw_image = True
+                    self._restart_prefetch()
             else:
                 self.logger.error(f"Unknown configuration set: '{key}': '{value}'")
 
@@ -1578,14 +2166,23 @@ class OffScreen(BaseScreen):
         self.bg_color = BLACK
         self.fill(self.bg_color)
 
+    def activate(self):
+        super(OffScreen, self).activate()
+        self.fill(self.bg_color)
+
     def configure(self):
         # This screen cannot be configured
         pass
 
+    @profiled
     def update(self):
         # Noting to update
         pass
 
+    def get_next_frame_delay(self):
+        # This screen never changes
+        return None
+
 
 # ---- SCREEN THREAD / HANDLER ------------
 class Screen(Enum):
@@ -1602,7 +2199,8 @@ class Screen(Enum):
 
 class GuiThread(threading.Thread):
     def __init__(self, size, full_screen, switch_delay_after_event=0, switch_to_screen_after_event='off', cec_enable=False, hdmi_port_nbr=1,
-                 standby_enable=False, logger=None):
+                 standby_enable=False, dirty_rect_enable=True, profiler_enable=False, profiler_overlay=False,
+                 image_cache_size=64, image_decoder="pygame", logger=None):
         threading.Thread.__init__(self, daemon=True, name="GuiThread")
         self.logger = logger if logger is not None else Logger(verbose=True, file_path=".\\GuiHandler.log")
 
@@ -1614,6 +2212,24 @@ class GuiThread(threading.Thread):
         self.switch_delay_after_event     = switch_delay_after_event
         self.switch_to_screen_after_event = switch_to_screen_after_event
 
+        # If enabled, only the areas reported as changed by the screen are copied to the display. Otherwise the
+        # whole screen is copied and flipped on every frame
+        self.dirty_rect_enable            = dirty_rect_enable
+
+        # The profiler measures the update of every surface and the blit and flip of every frame
+        profiler.logger = self.logger
+        profiler.configure(enable=profiler_enable, show_overlay=profiler_overlay, frame_budget=1 / FPS)
+
+        # Memory in megabytes for the decoded and scaled images shared by all screens
+        image_cache.max_bytes = int(image_cache_size * 1024 * 1024)
+
+        # Library to decode the image files, Pillow is optional
+        try:
+            if not set_image_decoder(image_decoder.strip().lower()):
+                self.logger.warning("Pillow is not installed, the images are decoded with pygame instead")
+        except ValueError as e:
+            self.logger.error(f"Could not set image decoder, use '{get_image_decoder()}'", exception=e.args)
+
         self._timer_obj: Union[threading.Timer, None] = None
 
         self.tv_remote_obj = GraphicOutputDriver(logger=self.logger, cec_enable=cec_enable, hdmi_port_nbr=hdmi_port_nbr, standby_enable=standby_enable)
@@ -1621,11 +2237,33 @@ class GuiThread(threading.Thread):
         self._running    = False
         self._queue      = queue.Queue()
 
+        # Every screen is created once and reused on every screen change
+        self._screen_pool = dict()
+
         self._fps = FPS
         self._screen_updated = False
 
     def change_screen(self, data):
         self._queue.put(data)
+        latency_tracker.mark(LatencyStage.queued)
+
+    def _get_screen_obj(self, screen_name: Screen, size):
+        """
+        Return the instance of the requested screen from the pool. Create it if it is not yet available
+        """
+        screen_obj = self._screen_pool.get(screen_name)
+        if screen_obj is None:
+            self.logger.debug(f"Create screen {screen_name}")
+            screen_obj = screen_name.value(size=size, logger=self.logger)
+            self._screen_pool[screen_name] = screen_obj
+        return screen_obj
+
+    def _build_screen_pool(self, size):
+        """
+        Create all screens in advance, so a screen change only has to activate and configure the screen
+        """
+        for screen_name in Screen:
+            self._get_screen_obj(screen_name=screen_name, size=size)
 
     def run(self):
 
@@ -1634,8 +2272,14 @@ class GuiThread(threading.Thread):
         else:
             window = pygame.display.set_mode(self.size)
 
-        clock      = pygame.time.Clock()
-        screen_obj = None
+        self._build_screen_pool(size=window.get_size())
+        profiler_font = get_font_obj(font_name=DEFAULT_FONT, font_size=16)
+        overlay_rect  = pygame.Rect(0, 0, 0, 0)
+
+        screen_obj      = None
+        screen_change   = True
+        screen_modified = False  # True as long as a new screen or configuration has not been shown yet
+        next_frame_time = time.monotonic()
 
         self._running = True
         while self._running:
@@ -1651,11 +2295,27 @@ class GuiThread(threading.Thread):
                     if event.key == pygame.K_ESCAPE:
                         self._running = False
 
-            # Check queue for data (new screen oder configuration for current screen)
+                    # Show or hide the profiler overlay and redraw the whole screen to remove it
+                    elif event.key == pygame.K_F12:
+                        profiler.toggle_overlay()
+                        self.logger.info(f"Set profiler overlay to {profiler.show_overlay}")
+                        screen_change = True
+                        next_frame_time = time.monotonic()
+
+            # Wait for data in the queue (new screen oder configuration for current screen) until the current screen
+            # needs the next frame. Wake up regularly to check the user interaction
+            if next_frame_time is None:
+                timeout = EVENT_POLL_INTERVAL
+            else:
+                timeout = min(max(next_frame_time - time.monotonic(), 0), EVENT_POLL_INTERVAL)
+
             try:
                 screen_name   = None
                 screen_config = None
-                data          = self._queue.get_nowait()
+                data          = self._queue.get(timeout=timeout)
+
+                # Draw the next frame immediately to show the changes
+                next_frame_time = time.monotonic()
 
                 if isinstance(data, tuple):
                     screen_name = data[0]
@@ -1671,7 +2331,11 @@ class GuiThread(threading.Thread):
                     self.logger.error(f"Unknown data type '{type(data)}' received from queue")
 
                 if screen_name is not None:
-                    screen_obj = screen_name.value(size=window.get_size(), logger=self.logger)
+                    if screen_obj is not None:
+                        screen_obj.deactivate()
+                    screen_obj = self._get_screen_obj(screen_name=screen_name, size=window.get_size())
+                    screen_obj.activate()
+                    screen_change = True
 
                     # On a screen change always check if status of the television shall be changed
                     if screen_name == Screen.off:
@@ -1691,23 +2355,69 @@ class GuiThread(threading.Thread):
                 if screen_config is not None:
                     if hasattr(screen_obj, "configure"):
                         screen_obj.configure(**screen_config)
+                        latency_tracker.mark(LatencyStage.configured)
                     else:
                         self.logger.error(f"Failed to configer {screen_obj.__class__.__name__}, this object dies not have a 'configure' attribute")
+                screen_modified = True
             except queue.Empty:
                 pass
 
-            # Fill the background with white
-            window.fill((255, 255, 255))
-            if screen_obj is not None:
+            # Check if the current screen needs a new frame
+            if next_frame_time is None or time.monotonic() < next_frame_time:
+                continue
+            frame_time = time.monotonic()
+
+            # Inform the surfaces showing the time if the second, minute or date has changed
+            tick_service.tick()
+
+            if screen_obj is None:
+                # Fill the background with white
+                window.fill((255, 255, 255))
+                pygame.display.flip()
+            else:
                 screen_obj.update()
-                window.blit(screen_obj, (0, 0))
-            pygame.display.flip()
+                dirty_rects = screen_obj.get_dirty_rects()
+
+                with profiler.measure("GuiThread.blit"):
+                    if screen_change or not self.dirty_rect_enable:
+                        # Show the whole screen
+                        window.blit(screen_obj, (0, 0))
+                        dirty_rects = None
+                    else:
+                        # Only copy the areas which have been changed since the last frame
+                        for rect in dirty_rects:
+                            window.blit(screen_obj, rect, rect)
+
+                if profiler.show_overlay:
+                    # Restore the screen below the last overlay, as the new one may be smaller, and draw it again
+                    window.blit(screen_obj, overlay_rect, overlay_rect)
+                    last_overlay_rect = overlay_rect
+                    overlay_rect = profiler.draw_overlay(surface=window, font=profiler_font)
+                    if dirty_rects is not None:
+                        dirty_rects.append(overlay_rect.union(last_overlay_rect))
+
+                with profiler.measure("GuiThread.flip"):
+                    if dirty_rects is None:
+                        pygame.display.flip()
+                        screen_change = False
+                    elif dirty_rects:
+                        pygame.display.update(dirty_rects)
 
             # Inform that the screen is now updated
             self._screen_updated = True
-
-            # Control the FPS
-            clock.tick(self._fps)
+            if screen_modified:
+                latency_tracker.mark(LatencyStage.frame_flipped)
+                screen_modified = False
+            if profiler.enabled:
+                profiler.record("GuiThread.frame", time.monotonic() - frame_time)
+                profiler.dump_if_due()
+
+            # Schedule the next frame as requested by the screen, but never faster than the FPS
+            frame_delay = screen_obj.get_next_frame_delay() if screen_obj is not None else None
+            if frame_delay is None:
+                next_frame_time = None
+            else:
+                next_frame_time = frame_time + max(frame_delay, 1 / self._fps)
 
     def stop(self):
         self._running = False
@@ -1749,6 +2459,8 @@ class GuiHandler(object):
         self._thread = None
         self._current_screen = None
 
+        latency_tracker.logger = self.logger
+
         screen_info = pygame.display.Info()
         if self.gui_settings.get("full_screen_enable", False):
             self.size = (screen_info.current_w, screen_info.current_h)
@@ -1802,6 +2514,11 @@ class GuiHandler(object):
                                  cec_enable                   = self.gui_settings.get("cec_enable", False),
                                  hdmi_port_nbr                = self.gui_settings.get("hdmi_port_number", 1),
                                  standby_enable               = self.gui_settings.get("standby_enable", False),
+                                 dirty_rect_enable            = self.gui_settings.get("dirty_rect_enable", True),
+                                 profiler_enable              = self.gui_settings.get("profiler_enable", False),
+                                 profiler_overlay             = self.gui_settings.get("profiler_overlay", False),
+                                 image_cache_size             = self.gui_settings.get("image_cache_size", 64),
+                                 image_decoder                = self.gui_settings.get("image_decoder", "pygame"),
                                  logger                       = self.logger)
 
         # Deactivate mouse over GUI and set the SplashScreen as default start screen
@@ -1830,6 +2547,27 @@ class GuiHandler(object):
     def is_running(self):
         return self._thread.is_alive()
 
+    @staticmethod
+    def get_latency_statistics():
+        """
+        Return the p50, p95 and max time in seconds from the modification of the alarm file to each stage
+        """
+        return latency_tracker.get_statistics()
+
+    @staticmethod
+    def get_image_cache_statistics():
+        """
+        Return the amount of cached images, their memory and the hit rate of the image cache
+        """
+        return image_cache.get_statistics()
+
+    @staticmethod
+    def get_text_cache_statistics():
+        """
+        Return the amount of cached texts, their memory and the hit rate of the text cache
+        """
+        return text_cache.get_statistics()
+
 
 def test_screen_top(screen_obj):
     def update_screen():
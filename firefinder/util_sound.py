@@ -7,6 +7,9 @@ import threading
 
 from pathlib import Path
 from firefinder.util_logger import Logger
+from firefinder.util_latency import latency_tracker, LatencyStage
+
+SOUND_POLL_INTERVAL = 0.05  # Time in seconds between two checks if the track has ended
 
 
 def set_volume(volume=0.5):
@@ -24,6 +27,7 @@ class AlarmSound(object):
         self.logger = logger if logger is not None else Logger(verbose=True, file_path=".\\AlarmSound.log")
         self._thread = None
         self._running = False
+        self._stop_event = threading.Event()
 
         pygame.mixer.init(frequency=22050, size=16, channels=2, buffer=4096)
         set_volume(1.00)  # set volume to maximum and handle the volume manual at the TV
@@ -54,11 +58,14 @@ class AlarmSound(object):
                        the music will repeat indefinitely.
         """
 
-        # do not start thread as long as the one is still running
-        if (self._thread is None or not self._thread.is_alive()) and self.sound_file_path:
-            self._thread = threading.Thread(target=self.__sound_thread, args=(loops, offset, delay, pause), daemon=True)
-            self._thread.start()  # start the thread which plays the given music
+        # do not start thread as long as the one is still running. A stopped thread may still be alive until it
+        # notice its stop event, but it will not play anything anymore
+        if not self._running and self.sound_file_path:
+            self._stop_event = threading.Event()
+            self._thread = threading.Thread(target=self.__sound_thread, args=(loops, offset, delay, pause, self._stop_event),
+                                            daemon=True)
             self._running = True
+            self._thread.start()  # start the thread which plays the given music
 
     def stop(self):
         """
@@ -66,6 +73,7 @@ class AlarmSound(object):
         """
 
         self._running = False
+        self._stop_event.set()
 
         try:
             pygame.mixer.music.stop()
@@ -97,46 +105,45 @@ class AlarmSound(object):
         else:
             self.logger.warning("Failed settings new sound file")
 
-    def __sound_thread(self, loops=0, offset=0.0, delay=0, pause=0):
+    def __sound_thread(self, loops=0, offset=0.0, delay=0, pause=0, stop_event=None):
         # catch exceptions in this thread
         threading.excepthook = self.logger.thread_except_hook
 
         self.logger.info(f"Now playing sound file '{self.sound_file_path}'", loops=loops, offset=offset, delay=delay, pause=pause)
 
-        # Check for delay before playing sound
-        if delay != 0 and self._running:
-            _delay = delay
-            while _delay > 0:
-                time.sleep(0.1)
-                _delay -= 0.1
-                if self._running is False:
-                    break
+        # The thread sleeps on the stop event for the delay, the pause and while the track is playing. So it does not
+        # use any CPU while waiting, but stops immediately as soon as the sound is stopped. The end event of the mixer
+        # is not used, as it is sent to the event queue of the GuiThread.
 
-        while loops != 0 and self._running:
+        # Check for delay before playing sound
+        if delay != 0:
+            stop_event.wait(delay)
 
-            if not self._running:
-                break
+        while loops != 0 and not stop_event.is_set():
 
             self.__play_track_one(offset)
 
-            while pygame.mixer.music.get_busy():
-                continue
+            while pygame.mixer.music.get_busy() and not stop_event.wait(SOUND_POLL_INTERVAL):
+                pass
 
             if loops != -1:  # Check if loop is infinite
                 loops -= 1  # no, so decrement variable by 1
 
             if pause != 0:
-                time.sleep(pause)
+                stop_event.wait(pause)
 
-        # Music played completely
-        self._running = False
+        # Music played completely. Do not touch the state if a new sound has already been started meanwhile
+        if stop_event is self._stop_event:
+            self._running = False
 
     def __play_track_one(self, offset):
         try:
             pygame.mixer.music.play(loops=0, start=offset)
+            latency_tracker.mark(LatencyStage.sound_started)
         except Exception as e:
             self.logger.error(f"Error occurs during playing '{self.sound_file_path}'", exception=e.args)
             self._running = False
+            self._stop_event.set()
             self.sound_file_path = ""
 
     def is_running(self):
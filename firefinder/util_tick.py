@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+import weakref
+import threading
+
+from enum import IntEnum
+from datetime import datetime, timedelta
+
+
+class TickUnit(IntEnum):
+    """
+    Units of the time shown by the surfaces. A change of a larger unit always includes the smaller ones, a new day
+    is also a new minute and a new second.
+    """
+    second = 0
+    minute = 1
+    date   = 2
+
+
+class TickService(object):
+    def __init__(self):
+        """
+        Central clock for all surfaces which show the time. The GuiThread calls tick() once before every frame and
+        the subscribers are only informed if the second, minute or date has changed since the last tick. The
+        surfaces take the time from now(), so all surfaces of a frame show the same time and nothing is redrawn
+        as long as the shown time does not change.
+        """
+        self._lock        = threading.Lock()
+        self._subscribers = []
+        self._now         = datetime.now()
+
+    def subscribe(self, callback):
+        """
+        Call the callback with the largest changed TickUnit and the current time on every change. For bound
+        methods only a weak reference is stored, so the subscription ends with the lifetime of the object.
+
+        :param callback: Function with the parameters unit and now
+        """
+        if hasattr(callback, "__self__"):
+            reference = weakref.WeakMethod(callback)
+        else:
+            reference = lambda: callback
+        with self._lock:
+            self._subscribers.append(reference)
+
+    def now(self):
+        """
+        Return the time of the last tick
+        """
+        return self._now
+
+    def tick(self, now=None):
+        """
+        Take over the current time and inform the subscribers if it has changed
+
+        :param now: Current time, the time of the system if None
+        :return:    The largest changed TickUnit or None if the second has not changed
+        """
+        if now is None:
+            now = datetime.now()
+        last, self._now = self._now, now
+
+        if now.date() != last.date():
+            unit = TickUnit.date
+        elif (now.hour, now.minute) != (last.hour, last.minute):
+            unit = TickUnit.minute
+        elif now.second != last.second:
+            unit = TickUnit.second
+        else:
+            return None
+
+        with self._lock:
+            self._subscribers = [s for s in self._subscribers if s() is not None]
+            subscribers = list(self._subscribers)
+        for reference in subscribers:
+            callback = reference()
+            if callback is not None:
+                callback(unit, now)
+        return unit
+
+    @staticmethod
+    def get_next_tick_delay(unit):
+        """
+        Return the time in seconds until the given unit changes the next time
+        """
+        now = datetime.now()
+        if unit == TickUnit.second:
+            return 1 - now.microsecond / 1000000
+        elif unit == TickUnit.minute:
+            return 60 - now.second - now.microsecond / 1000000
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        return (midnight - now).total_seconds()
+
+
+# Shared instance, all surfaces showing the time are driven by the same clock
+tick_service = TickService()
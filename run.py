@@ -53,7 +53,12 @@ class ConfigFile(object):
                 "switch_to_screen_after_event"    : self._get_value('Visual', 'switchToScreenAfterEvent', default='Off'),
                 "cec_enable"                      : self._get_boolean('Power', 'cec_enable', default=False),
                 "hdmi_port_number"                : self._get_int('Power', 'hdmi_televison_port_number', default=1),
-                "standby_enable"                  : self._get_boolean('Power', 'stdby_enable', default=False)
+                "standby_enable"                  : self._get_boolean('Power', 'stdby_enable', default=False),
+                "dirty_rect_enable"               : self._get_boolean('Performance', 'dirty_rect_update', default=True),
+                "profiler_enable"                 : self._get_boolean('Performance', 'profiler_enable', default=False),
+                "profiler_overlay"                : self._get_boolean('Performance', 'profiler_overlay', default=False),
+                "image_cache_size"                : self._get_int('Performance', 'image_cache_size', default=64),
+                "image_decoder"                   : self._get_value('Performance', 'image_decoder', default="pygame")
             }
 
             # [SplashScreen]
@@ -67,6 +72,7 @@ class ConfigFile(object):
                 "fade_over_background"   : self._get_boolean('Slideshow', 'fade_over_background', default=True),
                 "seconds_between_images" : self._get_int('Slideshow', 'seconds_between_images', default=60),
                 "sort_alphabetically"    : self._get_boolean('Slideshow', 'sort_alphabetically', default=True),
+                "cache_path"             : self._get_value('Slideshow', 'cache_path', default=""),
                 "show_header_bar"        : self._get_boolean('Slideshow', 'show_header_bar', default=True),
                 "company_path_logo"      : self._get_value('Visual', 'company_path_logo', default=""),
                 "company_name"           : self._get_value('Visual', 'company_name', default="")